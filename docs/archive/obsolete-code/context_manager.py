@@ -6,11 +6,33 @@ Enforces strict token limits to prevent context window overflow.
 """
 
 import json
-import yaml
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+# Agent stages and explicit PO decisions
+STAGE_SM = 'sm'
+STAGE_PO = 'po'
+STAGE_DEV = 'dev'
+STAGE_QA = 'qa'
+
+DECISION_APPROVED = 'APPROVED'
+DECISION_BLOCKED = 'BLOCKED'
+DECISION_CHANGES_REQUESTED = 'CHANGES_REQUESTED'
+PO_DECISIONS = frozenset({DECISION_APPROVED, DECISION_BLOCKED, DECISION_CHANGES_REQUESTED})
+
+# Preconfigured encoders - json.dumps builds a new JSONEncoder on every call
+# that passes non-default options, so reuse one instance per format
+_encode_compact = json.JSONEncoder(separators=(',', ':'), default=str).encode
+_encode_snapshot = json.JSONEncoder(indent=2).encode
+
 
 def estimate_tokens(text: str) -> int:
     """
@@ -20,10 +42,30 @@ def estimate_tokens(text: str) -> int:
 
     For precise counting, would use tiktoken, but this is adequate for limits.
     """
-    if not text:
-        return 0
-    # Conservative estimate: 1 token per 3.5 chars (vs actual ~4 chars/token)
-    return int(len(text) / 3.5) + 1
+    return _tokens_for_chars(len(text)) if text else 0
+
+
+def _tokens_for_chars(char_count: int) -> int:
+    """Token estimate for a known character count (see estimate_tokens)."""
+    # Conservative estimate: 1 token per 3.5 chars (vs actual ~4 chars/token),
+    # in integer arithmetic: floor(n / 3.5) == (2 * n) // 7
+    return char_count * 2 // 7 + 1
+
+
+def _estimate_json_chars(value) -> int:
+    """
+    Estimate the compact JSON length of value without serializing it.
+    Exact for plain ASCII data; escapes and non-ASCII text are not counted.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 1 + sum(len(k) + 4 + _estimate_json_chars(v) for k, v in value.items()) + (not value)
+    if isinstance(value, (list, tuple, deque)):
+        return 1 + sum(_estimate_json_chars(item) + 1 for item in value) + (not value)
+    if value is None:
+        return 4
+    return len(str(value))
 
 
 class StoryHandoff:
@@ -37,6 +79,7 @@ class StoryHandoff:
     MAX_SUMMARY_LENGTH = 2000  # characters
     MAX_ACCEPTANCE_CRITERIA = 10  # items
     MAX_FILES_TRACKED = 20  # files
+    MAX_BLOCKERS_TRACKED = 20  # blockers
 
     # Token limits (CRITICAL - prevents context window overflow)
     # Agent context window: 200k tokens
@@ -48,23 +91,66 @@ class StoryHandoff:
     def __init__(self, story_id: str, project_path: Path):
         self.story_id = story_id
         self.project_path = project_path
-        self.handoff_file = project_path / f".bmad-handoff-{story_id}.yaml"
+        self.handoff_file = project_path / f".bmad-handoff-{story_id}.json"
+        # Append-only log of mutations since the last snapshot
+        self.journal_file = project_path / f".bmad-handoff-{story_id}.jsonl"
         self.data = self._initialize()
+        # Journal lines not yet written (deferred while inside batch())
+        self._pending: List[str] = []
+        self._batching = 0
+
+    @classmethod
+    def load_many(cls, story_ids: List[str], project_path: Path, workers: int = 8) -> List['StoryHandoff']:
+        """
+        Load handoffs for several stories concurrently (e.g. for a dashboard).
+        File reads overlap across threads; results keep the order of story_ids.
+        """
+        if len(story_ids) <= 1:
+            return [cls(story_id, project_path) for story_id in story_ids]
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(story_ids))) as executor:
+            return list(executor.map(lambda story_id: cls(story_id, project_path), story_ids))
 
     def _initialize(self) -> Dict:
-        """Initialize or load handoff data."""
-        if self.handoff_file.exists():
-            with open(self.handoff_file, 'r') as f:
-                return yaml.safe_load(f) or {}
+        """Initialize or load handoff data (snapshot + journal replay)."""
+        self._persisted = self.handoff_file.exists() or self.journal_file.exists()
 
-        return {
-            'story_id': self.story_id,
-            'created_at': datetime.now().isoformat(),
-            'stages': {},
-            'files_modified': [],
-            'decisions': [],
-            'blockers': []
-        }
+        if self.handoff_file.exists():
+            data = json.loads(self.handoff_file.read_bytes()) or {}
+        else:
+            data = {
+                'story_id': self.story_id,
+                'created_at': datetime.now().isoformat(),
+                'stages': {},
+                'files_modified': [],
+                'blockers': []
+            }
+
+        # Decisions are derived from stages (see the decisions property)
+        data.pop('decisions', None)
+
+        # Bounded collections - appends evict the oldest entry in O(1)
+        data['files_modified'] = deque(data.get('files_modified', []), maxlen=self.MAX_FILES_TRACKED)
+        data['blockers'] = deque(data.get('blockers', []), maxlen=self.MAX_BLOCKERS_TRACKED)
+
+        if self.journal_file.exists():
+            good = 0  # Offset just past the last complete line
+            with open(self.journal_file, 'rb') as f:  # json.loads decodes bytes itself
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Torn final write - ignore the tail
+                    good += len(line)
+                    try:
+                        op = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Damaged record - keep replaying the rest
+                    self._apply(data, op)
+                size = f.tell()
+            if good < size:
+                # Cut the torn tail so the next append starts on a fresh line
+                os.truncate(self.journal_file, good)
+
+        return data
 
     def add_stage_summary(self, stage: str, summary: str, decision: Optional[str] = None):
         """
@@ -79,45 +165,117 @@ class StoryHandoff:
         if len(summary) > self.MAX_SUMMARY_LENGTH:
             summary = summary[:self.MAX_SUMMARY_LENGTH] + "... [truncated]"
 
-        self.data['stages'][stage] = {
+        self._record({
+            'op': 'stage',
+            'stage': stage,
             'summary': summary,
             'decision': decision,
             'timestamp': datetime.now().isoformat()
-        }
-
-        if decision:
-            self.data['decisions'].append({
-                'stage': stage,
-                'decision': decision,
-                'timestamp': datetime.now().isoformat()
-            })
-
-        self._save()
+        })
 
     def add_file_modified(self, file_path: str, action: str = "modified"):
         """Track files modified, with limit to prevent bloat."""
-        file_entry = {
-            'path': file_path,
+        self.batch_add_files_modified([file_path], action)
+
+    def batch_add_files_modified(self, file_paths: List[str], action: str = "modified"):
+        """Track several modified files with a single journal write."""
+        if not file_paths:
+            return
+        self._record({
+            'op': 'files',
+            'paths': list(file_paths),
             'action': action,
             'timestamp': datetime.now().isoformat()
-        }
-
-        self.data['files_modified'].append(file_entry)
-
-        # Keep only recent files if exceeding limit
-        if len(self.data['files_modified']) > self.MAX_FILES_TRACKED:
-            self.data['files_modified'] = self.data['files_modified'][-self.MAX_FILES_TRACKED:]
-
-        self._save()
+        })
 
     def add_blocker(self, blocker: str, stage: str):
         """Add a blocker issue."""
-        self.data['blockers'].append({
+        self._record({
+            'op': 'blocker',
             'blocker': blocker,
             'stage': stage,
             'timestamp': datetime.now().isoformat()
         })
-        self._save()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer journal writes until the outermost batch exits.
+
+        Usage:
+            with handoff.batch():
+                handoff.add_file_modified(...)
+                handoff.add_stage_summary(...)
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching:
+                self._flush()
+
+    def _record(self, op: Dict):
+        """Apply a mutation in memory and queue it for the journal."""
+        self._apply(self.data, op)
+        self._pending.append(_encode_compact(op) + "\n")
+        if not self._batching:
+            self._flush()
+
+    def _flush(self):
+        """Append pending operations to the journal in a single write."""
+        if not self._pending:
+            return
+
+        with open(self.journal_file, 'a') as f:
+            if not self._persisted:
+                # First write for a new handoff - record its creation time
+                create = {'op': 'create', 'timestamp': self.data['created_at']}
+                f.write(_encode_compact(create) + "\n")
+                self._persisted = True
+            f.write(''.join(self._pending))
+        self._pending.clear()
+
+    @staticmethod
+    def _apply(data: Dict, op: Dict):
+        """Apply a single journal operation to handoff data."""
+        kind = op['op']
+        now = op['timestamp']
+        # Stage/decision/action names repeat across entries - share one copy
+        intern = sys.intern
+
+        if kind == 'create':
+            data['created_at'] = now
+
+        elif kind == 'stage':
+            stage = intern(op['stage'])
+            decision = op['decision'] and intern(op['decision'])
+            data['stages'][stage] = {
+                'summary': op['summary'],
+                'decision': decision,
+                'timestamp': now
+            }
+
+        elif kind == 'files':
+            action = intern(op['action'])
+            files = data['files_modified']
+            # Re-recording a tracked (path, action) refreshes its timestamp
+            tracked = {(f['path'], f['action']): f for f in files}
+            added = []
+            for path in dict.fromkeys(op['paths']):
+                entry = tracked.get((path, action))
+                if entry is not None:
+                    entry['timestamp'] = now
+                else:
+                    added.append({'path': path, 'action': action, 'timestamp': now})
+            files.extend(added)
+
+        elif kind == 'blocker':
+            data['blockers'].append({
+                'blocker': op['blocker'],
+                'stage': intern(op['stage']),
+                'timestamp': now
+            })
 
     def get_context_for_stage(self, stage: str) -> tuple[Dict, int]:
         """
@@ -133,39 +291,15 @@ class StoryHandoff:
         }
 
         # Stage-specific context
-        if stage == 'po':
-            # PO needs SM's story definition
-            if 'sm' in self.data['stages']:
-                context['previous_stages']['sm'] = {
-                    'summary': self.data['stages']['sm']['summary']
-                }
-
-        elif stage == 'dev':
-            # Dev needs PO approval status and any guidance
-            if 'po' in self.data['stages']:
-                po_stage = self.data['stages']['po']
-                context['previous_stages']['po'] = {
-                    'decision': po_stage.get('decision'),
-                    'summary': po_stage['summary'][:500]  # Truncated
-                }
-
-        elif stage == 'qa':
-            # QA needs list of modified files and dev summary
-            if 'dev' in self.data['stages']:
-                context['previous_stages']['dev'] = {
-                    'summary': self.data['stages']['dev']['summary'][:500]
-                }
-            context['files_modified'] = [
-                f['path'] for f in self.data['files_modified'][-10:]  # Last 10 files only
-            ]
+        builder = self._CONTEXT_BUILDERS.get(stage)
+        if builder:
+            builder(self, context)
 
         # Always include current blockers (if any)
         if self.data['blockers']:
-            context['blockers'] = self.data['blockers'][-3:]  # Last 3 blockers only
+            context['blockers'] = list(self.data['blockers'])[-3:]  # Last 3 blockers only
 
-        # Convert to YAML string to count tokens accurately
-        context_yaml = yaml.dump(context, default_flow_style=False)
-        token_count = estimate_tokens(context_yaml)
+        token_count = self._count_context_tokens(context)
 
         # Safety check - should never exceed limit due to truncation
         if token_count > self.MAX_CONTEXT_TOKENS:
@@ -177,11 +311,57 @@ class StoryHandoff:
                     stage_data['summary'] = stage_data['summary'][:200] + "... [truncated]"
 
             # Recount
-            context_yaml = yaml.dump(context, default_flow_style=False)
-            token_count = estimate_tokens(context_yaml)
+            token_count = self._count_context_tokens(context)
 
         return context, token_count
 
+    def _count_context_tokens(self, context: Dict) -> int:
+        """
+        Estimate context tokens from a structural walk, serializing to
+        compact JSON only when the estimate comes within 10% of the limit.
+        """
+        token_count = _tokens_for_chars(_estimate_json_chars(context))
+        if token_count > self.MAX_CONTEXT_TOKENS * 0.9:
+            context_json = _encode_compact(context)
+            token_count = estimate_tokens(context_json)
+        return token_count
+
+    def _context_po(self, context: Dict):
+        """PO needs SM's story definition."""
+        sm_stage = self.data['stages'].get(STAGE_SM)
+        if sm_stage:
+            context['previous_stages'][STAGE_SM] = {
+                'summary': sm_stage['summary']
+            }
+
+    def _context_dev(self, context: Dict):
+        """Dev needs PO approval status and any guidance."""
+        po_stage = self.data['stages'].get(STAGE_PO)
+        if po_stage:
+            context['previous_stages'][STAGE_PO] = {
+                'decision': po_stage.get('decision'),
+                'summary': po_stage['summary'][:500]  # Truncated
+            }
+
+    def _context_qa(self, context: Dict):
+        """QA needs list of modified files and dev summary."""
+        dev_stage = self.data['stages'].get(STAGE_DEV)
+        if dev_stage:
+            context['previous_stages'][STAGE_DEV] = {
+                'summary': dev_stage['summary'][:500]
+            }
+        files = self.data['files_modified']
+        context['files_modified'] = [
+            f['path'] for f in islice(files, max(len(files) - 10, 0), None)  # Last 10 files only
+        ]
+
+    # Stage -> context builder dispatch for get_context_for_stage
+    _CONTEXT_BUILDERS = {
+        STAGE_PO: _context_po,
+        STAGE_DEV: _context_dev,
+        STAGE_QA: _context_qa,
+    }
+
     def validate_po_decision(self) -> tuple[bool, str]:
         """
         Validate that PO made an explicit decision.
@@ -189,54 +369,99 @@ class StoryHandoff:
         Returns:
             (is_valid, message)
         """
-        if 'po' not in self.data['stages']:
+        if STAGE_PO not in self.data['stages']:
             return False, "PO stage not completed"
 
-        po_stage = self.data['stages']['po']
-        decision = po_stage.get('decision', '').upper()
+        po_stage = self.data['stages'][STAGE_PO]
+        decision = (po_stage.get('decision') or '').upper()
 
-        if decision not in ['APPROVED', 'BLOCKED', 'CHANGES_REQUESTED']:
+        if decision not in PO_DECISIONS:
             return False, f"PO must explicitly APPROVE, BLOCK, or request CHANGES. Got: {decision or 'NO DECISION'}"
 
-        if decision == 'BLOCKED' and not self.data['blockers']:
+        if decision == DECISION_BLOCKED and not self.data['blockers']:
             return False, "PO BLOCKED but provided no blocker reasons"
 
         return True, decision
 
+    @property
+    def decisions(self) -> List[Dict]:
+        """Stage decisions, oldest first, derived from the recorded stages."""
+        decisions = [
+            {'stage': stage, 'decision': info['decision'], 'timestamp': info['timestamp']}
+            for stage, info in self.data['stages'].items()
+            if info.get('decision')
+        ]
+        decisions.sort(key=lambda d: d['timestamp'])
+        return decisions
+
     def get_summary(self) -> str:
         """Get a brief summary of the handoff state."""
-        stages_completed = list(self.data['stages'].keys())
-        files_count = len(self.data['files_modified'])
-        blockers_count = len(self.data['blockers'])
+        data = self.data
+        blockers_count = len(data['blockers'])
 
-        summary = f"Story {self.story_id}:\n"
-        summary += f"  Stages: {' → '.join(stages_completed)}\n"
-        summary += f"  Files modified: {files_count}\n"
+        parts = [
+            f"Story {self.story_id}:\n",
+            f"  Stages: {' → '.join(data['stages'])}\n",
+            f"  Files modified: {len(data['files_modified'])}\n",
+        ]
 
         if blockers_count > 0:
-            summary += f"  ⚠ Blockers: {blockers_count}\n"
+            parts.append(f"  ⚠ Blockers: {blockers_count}\n")
 
         # Show latest decision
-        if self.data['decisions']:
-            latest = self.data['decisions'][-1]
-            summary += f"  Latest: {latest['stage'].upper()} - {latest['decision']}\n"
+        decisions = self.decisions
+        if decisions:
+            latest = decisions[-1]
+            parts.append(f"  Latest: {latest['stage'].upper()} - {latest['decision']}\n")
+
+        return ''.join(parts)
 
-        return summary
+    def checkpoint(self):
+        """Write a consolidated snapshot and truncate the journal."""
+        self._save()
+        self._persisted = True
+        self._pending.clear()  # Already captured by the snapshot
+        if self.journal_file.exists():
+            self.journal_file.unlink()
 
     def _save(self):
-        """Save handoff data to file."""
-        with open(self.handoff_file, 'w') as f:
-            yaml.dump(self.data, f, default_flow_style=False, sort_keys=False)
+        """Save handoff snapshot to file atomically (write temp, then rename)."""
+        tmp_file = self.handoff_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(_encode_snapshot(self._serializable()).encode())
+        os.replace(tmp_file, self.handoff_file)
+
+    def export_yaml(self, path: Path) -> Path:
+        """Export handoff data as YAML for external tooling."""
+        # yaml is only needed here, so keep it off the import path
+        import yaml
+        try:
+            from yaml import CSafeDumper as _Dumper
+        except ImportError:
+            from yaml import SafeDumper as _Dumper
+
+        with open(path, 'w') as f:
+            yaml.dump(self._serializable(), f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+        return path
+
+    def _serializable(self) -> Dict:
+        """Handoff data with bounded deques converted back to lists."""
+        return {k: list(v) if isinstance(v, deque) else v for k, v in self.data.items()}
 
     def cleanup(self):
-        """Remove handoff file after story completion."""
-        if self.handoff_file.exists():
-            self.handoff_file.unlink()
+        """Remove handoff snapshot and journal after story completion."""
+        for path in (self.handoff_file, self.journal_file):
+            if path.exists():
+                path.unlink()
 
 
 class AgentValidator:
     """Validates agent outputs to ensure quality and completeness."""
 
+    # Decision/result markers, matched case-insensitively in a single pass.
+    # Markers are ASCII, so ASCII-only case folding is sufficient.
+    PO_DECISION_RE = re.compile(r'APPROVE|BLOCK|CHANGES REQUESTED|CHANGE REQUEST', re.IGNORECASE | re.ASCII)
+    QA_RESULT_RE = re.compile(r'PASS|SUCCESS|FAIL|ERROR', re.IGNORECASE | re.ASCII)
+
     @staticmethod
     def validate_po_output(output: str, handoff: StoryHandoff) -> tuple[bool, str]:
         """
@@ -245,14 +470,8 @@ class AgentValidator:
         Returns:
             (is_valid, message)
         """
-        output_upper = output.upper()
-
         # Check for explicit decision markers
-        has_approved = 'APPROVED' in output_upper or 'APPROVE' in output_upper
-        has_blocked = 'BLOCKED' in output_upper or 'BLOCK' in output_upper
-        has_changes = 'CHANGES REQUESTED' in output_upper or 'CHANGE REQUEST' in output_upper
-
-        if not (has_approved or has_blocked or has_changes):
+        if not AgentValidator.PO_DECISION_RE.search(output):
             return False, "PO output must contain explicit APPROVED, BLOCKED, or CHANGES REQUESTED"
 
         # Check handoff file has decision
@@ -283,12 +502,7 @@ class AgentValidator:
         Returns:
             (is_valid, message)
         """
-        output_upper = output.upper()
-
-        has_pass = 'PASS' in output_upper or 'SUCCESS' in output_upper
-        has_fail = 'FAIL' in output_upper or 'ERROR' in output_upper
-
-        if not (has_pass or has_fail):
+        if not AgentValidator.QA_RESULT_RE.search(output):
             return False, "QA output must contain explicit PASS/FAIL test results"
 
         return True, "QA results validated"
@@ -13,25 +13,226 @@ Version: 1.0.0
 """
 
 import asyncio
-import subprocess
+import codecs
+import hashlib
+import io
 import yaml
 import json
 import sys
 import os
+import pickle
+import re
+import shutil
+import signal
+import socket
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import libtmux
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.panel import Panel
-from rich.table import Table
-from rich import print as rprint
 
 # Import context management
 from src.context_manager import StoryHandoff, AgentValidator
 
+# libyaml-backed (C) safe loader/dumper when available
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# libuv-based event loop when available; cheaper subprocess spawn and pipe reads
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Local wall-clock format for human-facing timestamps
+_ISO_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# Reused encoder for result records and agent contexts - json.dumps builds
+# a new JSONEncoder on every call
+_encode_compact = json.JSONEncoder(separators=(',', ':'), default=str).encode
+
+# Story results keep wall-clock times as time.time_ns() integers; records
+# on disk carry them as ISO strings under these keys
+_RESULT_TIME_KEYS = {'start_ns': 'start_time', 'end_ns': 'end_time'}
+
+
+def _encode_result(result: Dict) -> str:
+    """Encode a story result as one JSONL record, formatting its times as ISO strings."""
+    record = {}
+    for key, value in result.items():
+        if key in _RESULT_TIME_KEYS:
+            record[_RESULT_TIME_KEYS[key]] = datetime.fromtimestamp(value / 1e9).isoformat()
+        else:
+            record[key] = value
+    return _encode_compact(record) + "\n"
+
+# Parsed YAML files: path -> (mtime_ns, size, pickled data), least recently
+# used first. Each hit unpickles a private copy, which is cheaper than deepcopy.
+_YAML_CACHE: OrderedDict = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# On-disk parse cache shared across runs, keyed by content hash. Bump the
+# header whenever the pickled layout or the loader changes.
+_PARSE_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'bmad'
+_PARSE_CACHE_HEADER = b'bmad-yaml-v1\n'
+_PARSE_CACHE_MAX = 32  # Newest entries kept; older ones are pruned on write
+
+
+class _SafeYAMLUnpickler(pickle.Unpickler):
+    """Unpickler limited to the types a YAML safe load can produce.
+
+    Refusing every other global means a planted cache file cannot run code.
+    """
+
+    _ALLOWED = {
+        ('builtins', 'set'), ('builtins', 'frozenset'), ('builtins', 'bytes'),
+        ('datetime', 'date'), ('datetime', 'datetime'),
+        ('datetime', 'timedelta'), ('datetime', 'timezone'),
+    }
+
+    def find_class(self, module, name):
+        if (module, name) not in self._ALLOWED:
+            raise pickle.UnpicklingError(f"{module}.{name} not allowed in parse cache")
+        return super().find_class(module, name)
+
+
+def _prune_parse_cache():
+    """Delete all but the newest _PARSE_CACHE_MAX cache entries."""
+    entries = sorted(_PARSE_CACHE_DIR.glob('yaml-*.pkl'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[_PARSE_CACHE_MAX:]:
+        stale.unlink(missing_ok=True)
+
+
+def _parse_yaml_persistent(raw: bytes) -> Tuple[Any, bytes]:
+    """Parse YAML bytes, reusing a pickled parse of identical content from an earlier run.
+
+    Returns:
+        Tuple of (data, pickle of data)
+    """
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_file = _PARSE_CACHE_DIR / f"yaml-{digest}.pkl"
+    try:
+        blob = cache_file.read_bytes()
+        if blob.startswith(_PARSE_CACHE_HEADER):
+            pickled = blob[len(_PARSE_CACHE_HEADER):]
+            return _SafeYAMLUnpickler(io.BytesIO(pickled)).load(), pickled
+    except Exception:
+        pass  # Missing, stale or foreign entry - parse the YAML instead
+
+    data = yaml.load(raw, Loader=_Loader)
+    pickled = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+    try:
+        _PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(_PARSE_CACHE_HEADER + pickled)
+        os.replace(tmp_file, cache_file)
+        _prune_parse_cache()
+    except OSError:
+        pass  # Cache is best-effort
+    return data, pickled
+
+
+def _load_yaml_cached(path: Path, persist: bool = False) -> Any:
+    """Load a YAML file, reusing the parse while its mtime and size are unchanged.
+
+    With persist, a miss also consults the on-disk parse cache, which pays
+    off for large files that rarely change. The result is never shared
+    with the cache, so callers may mutate it freely.
+    """
+    st = path.stat()
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _YAML_CACHE.move_to_end(key)
+        return pickle.loads(cached[2])
+
+    # Hand libyaml one buffer rather than a file stream it reads in chunks
+    raw = path.read_bytes()
+    if persist:
+        data, pickled = _parse_yaml_persistent(raw)
+    else:
+        data = yaml.load(raw, Loader=_Loader)
+        pickled = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, pickled)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return data
+
+
+# Every "key:" marker the agent output parser reacts to, matched anywhere in a line
+_OUTPUT_KEY_RE = re.compile(
+    rb'(output|file|path|decision|status|summary|created|modified|updated):',
+    re.IGNORECASE
+)
+
+# Shared console, created on first use
+_CONSOLE: Optional[Console] = None
+
+
+def _console() -> Console:
+    """Return the process-wide console.
+
+    Auto-highlighting is off: every message is explicitly marked up.
+    """
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = Console(highlight=False)
+    return _CONSOLE
+
+
+# Longest agent output line parsed; longer lines are skipped
+_STREAM_LINE_LIMIT = 1024 * 1024
+
+# Dev file records buffered before they are appended to the handoff journal;
+# a crash mid-run loses at most this many minus one
+_FILE_RECORD_FLUSH = 8
+
+
+async def _feed_stdin(stream: asyncio.StreamWriter, data: bytes):
+    """Write data to a subprocess's stdin and close it, tolerating an early exit."""
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # Agent exited without reading all of its context
+    finally:
+        stream.close()
+
+
+async def _drain_stream(stream: asyncio.StreamReader, head_limit: int,
+                        on_line: Optional[Callable[[bytes], None]] = None) -> str:
+    """Read a subprocess stream to EOF, returning at most its first head_limit bytes, decoded.
+
+    Each complete raw line is passed to on_line as it arrives, so
+    the full output is never held in memory. A multibyte character cut by
+    head_limit is dropped rather than decoded as U+FFFD.
+    """
+    head = bytearray()
+    truncated = False
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            continue  # Line over _STREAM_LINE_LIMIT; the reader has dropped it
+        if not line:
+            break
+        room = head_limit - len(head)
+        if room > 0:
+            head += line[:room]
+        if len(line) > room:
+            truncated = True
+        if on_line is not None:
+            on_line(line)
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    return decoder.decode(head, final=not truncated)
+
 
 class StoryDevelopmentMVP:
     """
@@ -39,18 +240,32 @@ class StoryDevelopmentMVP:
     Focuses ONLY on: SM draft → PO validate → Dev implement → QA test
     """
 
-    def __init__(self, project_path: str, epic_id: str, vm_safe_mode: bool = True, dry_run: bool = False):
+    def __init__(self, project_path: str, epic_id: str, vm_safe_mode: bool = True, dry_run: bool = False,
+                 concurrency: int = 1, workers: Optional[int] = None, inter_story_delay: float = 0):
         """Initialize the story development automation."""
         self.project_path = Path(project_path).resolve()
         self.epic_id = epic_id
         self.vm_safe_mode = vm_safe_mode
         self.dry_run = dry_run
-        self.console = Console()
+        self.concurrency = max(1, concurrency)
+        # Agent runs are submitted to a queue drained by this many workers
+        self.workers = max(1, workers or self.concurrency)
+        self._agent_queue: Optional[asyncio.Queue] = None
+        # Resolve executables once rather than searching PATH on every agent call
+        self._bmad_bin = shutil.which('bmad') or 'bmad'
+        self._nice_bin = shutil.which('nice') or 'nice'
+        # Optional pause after each story, for pacing load on the VM
+        self.inter_story_delay = 0 if dry_run else max(0.0, inter_story_delay)
+        self.console = _console()
 
         # Results tracking
         self.results = []
-        self.start_time = None
+        self.start_mono: Optional[float] = None  # time.monotonic() at run start
         self.checkpoint_file = self.project_path / f".bmad-checkpoint-{epic_id}.yaml"
+        self.results_file = self.project_path / f".bmad-results-{epic_id}.jsonl"
+        self._results_fd: Optional[int] = None
+        # Bytes of complete records found by load_results_log, if it ran
+        self._results_log_size: Optional[int] = None
 
         # Safety: Verify we're in VM if safe mode enabled
         if self.vm_safe_mode:
@@ -62,39 +277,27 @@ class StoryDevelopmentMVP:
         # Load pre-sharded stories
         self.stories = self.load_stories()
 
-        # Setup tmux for visibility
+        # Tmux for visibility, set up by initialize_tmux_session
         self.tmux_server = None
         self.session = None
-        if not dry_run:
-            try:
-                self.tmux_server = libtmux.Server()
-            except:
-                self.console.print("[yellow]⚠ Tmux not available. Continuing without session management.[/yellow]")
 
     def verify_vm_environment(self):
         """Ensure we're running in the test VM for safety."""
-        try:
-            hostname = subprocess.run(
-                ['hostname'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            ).stdout.strip()
-
-            if 'bmad-automation-test' not in hostname.lower():
-                self.console.print(Panel(
-                    "[red]⚠️  Not running in test VM![/red]\n\n"
-                    "For safety, please run in Proxmox VM 'bmad-automation-test'.\n"
-                    "Override with --no-vm-check if you're absolutely sure.\n\n"
-                    f"Current hostname: {hostname}",
-                    title="Safety Check Failed",
-                    style="red"
-                ))
-
-                if not click.confirm("Do you want to continue anyway?", default=False):
-                    sys.exit(1)
-        except Exception as e:
-            self.console.print(f"[yellow]Could not verify VM environment: {e}[/yellow]")
+        hostname = socket.gethostname()
+
+        if 'bmad-automation-test' not in hostname.lower():
+            from rich.panel import Panel
+            self.console.print(Panel(
+                "[red]⚠️  Not running in test VM![/red]\n\n"
+                "For safety, please run in Proxmox VM 'bmad-automation-test'.\n"
+                "Override with --no-vm-check if you're absolutely sure.\n\n"
+                f"Current hostname: {hostname}",
+                title="Safety Check Failed",
+                style="red"
+            ))
+
+            if not click.confirm("Do you want to continue anyway?", default=False):
+                sys.exit(1)
 
     def verify_planning_complete(self):
         """Ensure planning artifacts exist before automation."""
@@ -104,12 +307,23 @@ class StoryDevelopmentMVP:
             "Epic Plan": self.project_path / "docs" / "epics" / self.epic_id / "stories.yaml"
         }
 
+        # One directory listing per parent instead of a stat per file
+        listings = {}
         missing = []
         for name, path in required_files.items():
-            if not path.exists():
+            entries = listings.get(path.parent)
+            if entries is None:
+                try:
+                    with os.scandir(path.parent) as it:
+                        entries = {entry.name for entry in it}
+                except OSError:
+                    entries = set()
+                listings[path.parent] = entries
+            if path.name not in entries:
                 missing.append(f"  • {name}: {path}")
 
         if missing:
+            from rich.panel import Panel
             self.console.print(Panel(
                 "[red]Planning phase incomplete![/red]\n\n"
                 "Missing required artifacts:\n" + "\n".join(missing) + "\n\n"
@@ -126,8 +340,7 @@ class StoryDevelopmentMVP:
         epic_file = self.project_path / "docs" / "epics" / self.epic_id / "stories.yaml"
 
         try:
-            with open(epic_file, 'r') as f:
-                epic_data = yaml.safe_load(f)
+            epic_data = _load_yaml_cached(epic_file, persist=True)
 
             stories = epic_data.get('stories', [])
 
@@ -143,8 +356,19 @@ class StoryDevelopmentMVP:
             sys.exit(1)
 
     def initialize_tmux_session(self):
-        """Create tmux session for monitoring."""
-        if not self.tmux_server or self.dry_run:
+        """Create tmux session for monitoring.
+
+        Skipped for dry runs and when stdout is not a terminal, in which case
+        libtmux is never imported.
+        """
+        if self.dry_run or not sys.stdout.isatty():
+            return
+
+        try:
+            import libtmux
+            self.tmux_server = libtmux.Server()
+        except Exception:
+            self.console.print("[yellow]⚠ Tmux not available. Continuing without session management.[/yellow]")
             return
 
         session_name = f"bmad-epic-{self.epic_id}"
@@ -182,7 +406,7 @@ class StoryDevelopmentMVP:
         results = {
             'story_id': story_id,
             'title': story_title,
-            'start_time': datetime.now().isoformat(),
+            'start_ns': time.time_ns(),
             'stages': {},
             'success': False
         }
@@ -312,7 +536,7 @@ class StoryDevelopmentMVP:
             self.console.print("  [yellow]⚠ QA found issues[/yellow]")
             results['success'] = False
 
-        results['end_time'] = datetime.now().isoformat()
+        results['end_ns'] = time.time_ns()
 
         # Cleanup handoff file if story completed successfully
         if results['success']:
@@ -321,6 +545,35 @@ class StoryDevelopmentMVP:
         return results
 
     async def execute_agent(self, agent: str, task: str, context: Dict, handoff: StoryHandoff, timeout: int) -> Dict:
+        """
+        Run an agent on the worker pool, or inline if no pool is running.
+
+        Each submission carries its own future, so completions are delivered
+        straight back to the waiting story.
+        """
+        if self._agent_queue is None:
+            return await self._execute_agent(agent, task, context, handoff, timeout)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._agent_queue.put((future, (agent, task, context, handoff, timeout)))
+        return await future
+
+    async def _agent_worker(self):
+        """Pull agent submissions off the queue until a None sentinel arrives."""
+        while (item := await self._agent_queue.get()) is not None:
+            future, args = item
+            if future.cancelled():
+                continue
+            try:
+                result = await self._execute_agent(*args)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+    async def _execute_agent(self, agent: str, task: str, context: Dict, handoff: StoryHandoff, timeout: int) -> Dict:
         """
         Execute BMad agent with safety wrapper and context management.
 
@@ -331,8 +584,8 @@ class StoryDevelopmentMVP:
         """
 
         if self.dry_run:
-            # Simulate execution in dry run mode
-            await asyncio.sleep(1)
+            # Simulate execution in dry run mode; just yield to the event loop
+            await asyncio.sleep(0)
             # Simulate handoff updates
             decision = "APPROVED" if agent == 'po' else None
             summary = f"{agent.upper()} completed {task}"
@@ -365,84 +618,101 @@ class StoryDevelopmentMVP:
                 'output_path': str(self.project_path)
             }
 
-        # Prepare context file
-        context_file = f"/tmp/bmad_{agent}_{task}_context.yaml"
-        with open(context_file, 'w') as f:
-            yaml.dump(context, f)
+        # Context is piped to the agent on stdin as JSON (a YAML subset)
+        payload = _encode_compact(context).encode()
 
         # Build command with context clearing flag
         # --new-session ensures agent starts with fresh context (prevents bloat)
-        cmd = f"bmad {agent} --task {task} --context {context_file} --headless --new-session"
+        argv = [self._bmad_bin, agent, "--task", task, "--context", "-", "--headless", "--new-session"]
 
-        # Add safety wrapper if in VM
+        # Lower priority if in VM; the timeout itself is enforced by wait_for below
         if self.vm_safe_mode:
-            cmd = f"timeout {timeout}s nice -n 10 {cmd}"
+            argv = [self._nice_bin, "-n", "10", *argv]
 
+        process = None
         try:
-            # Execute command
-            process = await asyncio.create_subprocess_shell(
-                cmd,
+            # Execute command directly, without an intermediate shell
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=str(self.project_path)
+                limit=_STREAM_LINE_LIMIT,
+                cwd=str(self.project_path),
+                start_new_session=True  # Own process group, killed as a unit
             )
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout + 10  # Add buffer to timeout
-            )
-
-            success = process.returncode == 0
-
-            # Parse output for file paths, summaries, and decisions
+            # Parse output for file paths, summaries, and decisions as it
+            # streams in, keeping only the head of each stream in memory
             output_file = None
             output_path = str(self.project_path)
             summary = ""
             decision = None
+            file_records = []
+
+            def flush_file_records():
+                with handoff.batch():
+                    for path, action in file_records:
+                        handoff.add_file_modified(path, action)
+                file_records.clear()
+
+            def parse_line(line: bytes):
+                nonlocal output_file, output_path, summary, decision
+                keys = {key.lower() for key in _OUTPUT_KEY_RE.findall(line)}
+                if not keys:
+                    return
+                value = line.split(b':', 1)[1].strip().decode('utf-8', 'replace')
+
+                if b'output' in keys or b'file' in keys:
+                    output_file = value
+
+                if b'path' in keys:
+                    output_path = value
+
+                # Extract decision for PO
+                if agent == 'po' and (b'decision' in keys or b'status' in keys):
+                    decision = value.upper()
+
+                # Extract summary
+                if b'summary' in keys:
+                    summary = value
+
+                # Track file modifications for Dev as they are reported, so a
+                # run that fails late still leaves its progress in the handoff;
+                # every few records share one journal write
+                if agent == 'dev' and (b'created' in keys or b'modified' in keys or b'updated' in keys):
+                    action = "created" if b'created' in keys else "modified"
+                    file_records.append((value, action))
+                    if len(file_records) >= _FILE_RECORD_FLUSH:
+                        flush_file_records()
+
+            async def communicate():
+                # Awaiting the gather inside a coroutine lets a cancelled
+                # wait_for retrieve its CancelledError instead of leaking it
+                return await asyncio.gather(
+                    _feed_stdin(process.stdin, payload),
+                    _drain_stream(process.stdout, 5000, parse_line),
+                    _drain_stream(process.stderr, 2000),
+                    process.wait()
+                )
+
+            try:
+                _, stdout_str, stderr_str, _ = await asyncio.wait_for(communicate(), timeout=timeout)
+            finally:
+                # Persist the last few records even if the agent fails or times out
+                flush_file_records()
 
-            if success and stdout:
-                stdout_str = stdout.decode()
-                for line in stdout_str.split('\n'):
-                    line_lower = line.lower()
-
-                    if 'output:' in line_lower or 'file:' in line_lower:
-                        parts = line.split(':', 1)
-                        if len(parts) > 1:
-                            output_file = parts[1].strip()
-
-                    if 'path:' in line_lower:
-                        parts = line.split(':', 1)
-                        if len(parts) > 1:
-                            output_path = parts[1].strip()
-
-                    # Extract decision for PO
-                    if agent == 'po' and ('decision:' in line_lower or 'status:' in line_lower):
-                        parts = line.split(':', 1)
-                        if len(parts) > 1:
-                            decision = parts[1].strip().upper()
-
-                    # Extract summary
-                    if 'summary:' in line_lower:
-                        parts = line.split(':', 1)
-                        if len(parts) > 1:
-                            summary = parts[1].strip()
-
-                    # Track file modifications for Dev
-                    if agent == 'dev' and ('created:' in line_lower or 'modified:' in line_lower or 'updated:' in line_lower):
-                        parts = line.split(':', 1)
-                        if len(parts) > 1:
-                            file_path = parts[1].strip()
-                            action = "modified"
-                            if 'created:' in line_lower:
-                                action = "created"
-                            handoff.add_file_modified(file_path, action)
+            success = process.returncode == 0
+
+            if not success:
+                output_file, output_path, summary, decision = None, str(self.project_path), "", None
 
+            if success:
                 # Use first 500 chars of output as summary if none found
                 if not summary and stdout_str:
                     summary = stdout_str[:500].replace('\n', ' ').strip()
 
-            # Update handoff with stage results
-            if success:
+                # Update handoff with stage results
                 handoff.add_stage_summary(agent, summary or f"{agent} completed", decision)
 
             return {
@@ -451,14 +721,14 @@ class StoryDevelopmentMVP:
                 'task': task,
                 'summary': summary,
                 'decision': decision,
-                'stdout': stdout.decode()[:5000] if stdout else "",
-                'stderr': stderr.decode()[:2000] if stderr else "",
+                'stdout': stdout_str,
+                'stderr': stderr_str,
                 'output_file': output_file,
                 'output_path': output_path,
                 'returncode': process.returncode
             }
 
-        except asyncio.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
                 'success': False,
                 'agent': agent,
@@ -474,38 +744,107 @@ class StoryDevelopmentMVP:
                 'error': str(e),
                 'exception': True
             }
+        finally:
+            # Timed out, failed or cancelled: the agent runs in its own session,
+            # so Ctrl-C never reaches it - kill its whole group and reap it
+            if process is not None and process.returncode is None:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+
+    def open_results_log(self, resume: bool = False):
+        """Open the per-story results log for appending.
+
+        A fresh run starts the log empty. A resumed run keeps it, cutting
+        only a torn trailing record, or writes it out from the results of
+        an older all-in-one checkpoint. Dry runs keep no log.
+        """
+        if self.dry_run:
+            return
+
+        # O_DSYNC makes each append durable without a separate fsync
+        self._results_fd = os.open(
+            self.results_file,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_DSYNC | (0 if resume else os.O_TRUNC),
+            0o644
+        )
+        if not resume:
+            return
+        if self._results_log_size is not None:
+            # Results came from this log; drop any torn tail before appending
+            os.ftruncate(self._results_fd, self._results_log_size)
+        else:
+            os.ftruncate(self._results_fd, 0)
+            os.write(self._results_fd, "".join(map(_encode_result, self.results)).encode())
+
+    def close_results_log(self):
+        """Close the per-story results log."""
+        if self._results_fd is not None:
+            os.close(self._results_fd)
+            self._results_fd = None
 
     def save_checkpoint(self):
-        """Save progress checkpoint for recovery."""
+        """Save progress checkpoint for recovery.
+
+        The newest result is appended to the JSONL results log and the small
+        YAML manifest is replaced atomically, so each save writes O(1) data.
+        """
         checkpoint = {
             'epic_id': self.epic_id,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.strftime(_ISO_FORMAT),
             'completed_stories': len(self.results),
-            'total_stories': len(self.stories),
-            'results': self.results
+            'total_stories': len(self.stories)
         }
 
         try:
-            with open(self.checkpoint_file, 'w') as f:
-                yaml.dump(checkpoint, f, default_flow_style=False)
+            if self._results_fd is not None and self.results:
+                os.write(self._results_fd, _encode_result(self.results[-1]).encode())
+
+            tmp_file = self.checkpoint_file.with_suffix('.yaml.tmp')
+            with open(tmp_file, 'w') as f:
+                yaml.dump(checkpoint, f, Dumper=_Dumper, default_flow_style=False)
+            os.replace(tmp_file, self.checkpoint_file)
             self.console.print(f"[dim]  💾 Checkpoint saved[/dim]")
         except Exception as e:
             self.console.print(f"[yellow]Could not save checkpoint: {e}[/yellow]")
 
+    def load_results_log(self) -> List[Dict]:
+        """Read completed story results from the JSONL results log."""
+        results = []
+        size = 0
+        try:
+            with open(self.results_file, 'rb') as f:  # json.loads decodes bytes itself
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Torn final record from an interrupted write
+                    try:
+                        results.append(json.loads(line))
+                    except ValueError:
+                        break
+                    size += len(line)
+        except FileNotFoundError:
+            pass
+        self._results_log_size = size
+        return results
+
     def load_checkpoint(self) -> bool:
         """Load checkpoint if it exists."""
         if not self.checkpoint_file.exists():
             return False
 
+        from rich.panel import Panel
+
         try:
-            with open(self.checkpoint_file, 'r') as f:
-                checkpoint = yaml.safe_load(f)
+            checkpoint = _load_yaml_cached(self.checkpoint_file)
 
             if checkpoint['epic_id'] != self.epic_id:
                 return False
 
-            self.results = checkpoint.get('results', [])
-            completed = checkpoint.get('completed_stories', 0)
+            # Older checkpoints embedded the full results list
+            self.results = checkpoint.get('results') or self.load_results_log()
+            completed = len(self.results)
 
             self.console.print(Panel(
                 f"Found checkpoint with {completed} completed stories.\n"
@@ -525,8 +864,31 @@ class StoryDevelopmentMVP:
         if not self.results:
             return
 
+        from rich.panel import Panel
+        from rich.table import Table
+
+        # Status icons for each stage; PO failures are only a warning
+        ticks = {True: "✓", False: "✗"}
+        po_ticks = {True: "✓", False: "⚠"}
+        overall = {True: "[green]Complete[/green]", False: "[red]Failed[/red]"}
+        missing = {}
+
+        rows = []
+        successful = 0
+        for result in self.results:
+            stages = result.get('stages', missing)
+            ok = bool(result.get('success', False))
+            successful += ok
+            rows.append((
+                result.get('story_id', 'unknown'),
+                ticks[bool(stages.get('sm', missing).get('success'))],
+                po_ticks[bool(stages.get('po', missing).get('success'))],
+                ticks[bool(stages.get('dev', missing).get('success'))],
+                ticks[bool(stages.get('qa', missing).get('success'))],
+                overall[ok]
+            ))
+
         # Calculate statistics
-        successful = sum(1 for r in self.results if r.get('success', False))
         failed = len(self.results) - successful
         success_rate = (successful / len(self.results) * 100) if self.results else 0
 
@@ -539,25 +901,14 @@ class StoryDevelopmentMVP:
         table.add_column("QA", style="yellow")
         table.add_column("Status", style="green")
 
-        for result in self.results:
-            story_id = result.get('story_id', 'unknown')
-            stages = result.get('stages', {})
-
-            # Status icons for each stage
-            sm_status = "✓" if stages.get('sm', {}).get('success') else "✗"
-            po_status = "✓" if stages.get('po', {}).get('success') else "⚠"
-            dev_status = "✓" if stages.get('dev', {}).get('success') else "✗"
-            qa_status = "✓" if stages.get('qa', {}).get('success') else "✗"
-
-            overall = "[green]Complete[/green]" if result.get('success') else "[red]Failed[/red]"
-
-            table.add_row(story_id, sm_status, po_status, dev_status, qa_status, overall)
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print("\n")
         self.console.print(table)
 
         # Print statistics panel
-        duration = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+        duration = time.monotonic() - self.start_mono if self.start_mono is not None else 0
         duration_min = duration / 60
 
         stats_text = f"""
@@ -576,7 +927,10 @@ class StoryDevelopmentMVP:
 
     async def run_epic(self):
         """Run all stories in the epic."""
-        self.start_time = datetime.now()
+        from rich.panel import Panel
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+        self.start_mono = time.monotonic()
 
         # Display startup banner
         self.console.print(Panel.fit(
@@ -588,11 +942,21 @@ class StoryDevelopmentMVP:
             style="cyan"
         ))
 
-        # Check for checkpoint
-        resume_from = 0
-        if self.load_checkpoint():
-            resume_from = len(self.results)
-            self.console.print(f"[yellow]Resuming from story {resume_from + 1}[/yellow]\n")
+        # Check for checkpoint. Stories may finish out of order when run
+        # concurrently, so resume by story id rather than by position.
+        total = len(self.stories)
+        done_ids = set()
+        resume = self.load_checkpoint()
+        if resume:
+            done_ids = {r.get('story_id') for r in self.results}
+            self.console.print(f"[yellow]Resuming with {len(self.results)}/{total} stories complete[/yellow]\n")
+        else:
+            self.results = []
+        self.open_results_log(resume)
+        pending = [
+            (i, story) for i, story in enumerate(self.stories, start=1)
+            if story.get('id', f'story-{i}') not in done_ids
+        ]
 
         # Initialize tmux session
         self.initialize_tmux_session()
@@ -608,30 +972,75 @@ class StoryDevelopmentMVP:
 
             epic_task = progress.add_task(
                 f"[cyan]Processing epic {self.epic_id}",
-                total=len(self.stories)
+                total=total
             )
 
             # Skip already completed stories if resuming
-            if resume_from > 0:
-                progress.update(epic_task, completed=resume_from)
-
-            for i, story in enumerate(self.stories[resume_from:], start=resume_from + 1):
-                progress.update(
-                    epic_task,
-                    description=f"[cyan]Story {i}/{len(self.stories)}: {story.get('title', 'Untitled')[:40]}..."
-                )
-
-                result = await self.run_story_cycle(story, i, len(self.stories))
-                self.results.append(result)
-
-                progress.advance(epic_task)
-
-                # Save checkpoint after each story
-                self.save_checkpoint()
-
-                # Small delay between stories
-                if i < len(self.stories):
-                    await asyncio.sleep(2)
+            if total > len(pending):
+                progress.update(epic_task, completed=total - len(pending))
+
+            sem = asyncio.Semaphore(self.concurrency)
+            results_lock = asyncio.Lock()
+
+            # A story may list the ids it builds on in depends_on; it starts only
+            # once those have finished. Only earlier stories count, which keeps
+            # the graph acyclic and matches the sequential order.
+            position = {story.get('id', f'story-{i}'): i for i, story in enumerate(self.stories, start=1)}
+            finished = {story.get('id', f'story-{i}'): asyncio.Event() for i, story in pending}
+
+            async def _one(i: int, story: Dict) -> Dict:
+                depends_on = story.get('depends_on') or []
+                if isinstance(depends_on, str):
+                    depends_on = [depends_on]
+                for dep in depends_on:
+                    if dep in finished and position[dep] < i:
+                        await finished[dep].wait()
+
+                try:
+                    async with sem:
+                        progress.update(
+                            epic_task,
+                            description=f"[cyan]Story {i}/{total}: {story.get('title', 'Untitled')[:40]}..."
+                        )
+                        t0 = time.monotonic()
+                        result = await self.run_story_cycle(story, i, total)
+                        result['duration_s'] = round(time.monotonic() - t0, 3)
+
+                        # Optional delay between stories
+                        if self.inter_story_delay and i < total:
+                            await asyncio.sleep(self.inter_story_delay)
+                        return result
+                finally:
+                    finished[story.get('id', f'story-{i}')].set()
+
+            self._agent_queue = asyncio.Queue()
+            workers = [asyncio.create_task(self._agent_worker()) for _ in range(self.workers)]
+            tasks = [asyncio.create_task(_one(i, story)) for i, story in pending]
+            try:
+                for coro in asyncio.as_completed(tasks):
+                    result = await coro
+                    async with results_lock:
+                        self.results.append(result)
+                        progress.advance(epic_task)
+
+                        # Save checkpoint after each story
+                        self.save_checkpoint()
+            except BaseException:
+                # Stop sibling stories too: they would otherwise keep running,
+                # or wait forever on depends_on events, with agents left behind
+                for task in tasks:
+                    task.cancel()
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            else:
+                for _ in workers:
+                    self._agent_queue.put_nowait(None)
+            finally:
+                await asyncio.gather(*workers, return_exceptions=True)
+                self._agent_queue = None
+                self.close_results_log()
 
         # Print final summary
         self.print_summary()
@@ -650,7 +1059,13 @@ class StoryDevelopmentMVP:
 @click.option('--vm-check/--no-vm-check', default=True, help='Enforce VM safety check')
 @click.option('--dry-run', is_flag=True, help='Simulate execution without running agents')
 @click.option('--resume', is_flag=True, help='Resume from checkpoint if available')
-def main(project, epic, vm_check, dry_run, resume):
+@click.option('--concurrency', '-c', default=1, show_default=True, type=click.IntRange(min=1),
+              help='Number of stories to run at once')
+@click.option('--workers', '-w', default=None, type=click.IntRange(min=1),
+              help='Number of agents to run at once [default: concurrency]')
+@click.option('--inter-story-delay', default=0.0, show_default=True, type=click.FloatRange(min=0),
+              help='Seconds to pause after each story (ignored in dry runs)')
+def main(project, epic, vm_check, dry_run, resume, concurrency, workers, inter_story_delay):
     """
     BMad Story Development Automation MVP
 
@@ -677,11 +1092,20 @@ def main(project, epic, vm_check, dry_run, resume):
             project_path=project,
             epic_id=epic,
             vm_safe_mode=vm_check,
-            dry_run=dry_run
+            dry_run=dry_run,
+            concurrency=concurrency,
+            workers=workers,
+            inter_story_delay=inter_story_delay
         )
 
-        # Run the epic
-        asyncio.run(automation.run_epic())
+        # Run the epic; uvloop.run needs uvloop >= 0.18, older releases install a policy
+        uvloop_run = getattr(uvloop, 'run', None)
+        if uvloop_run is not None:
+            uvloop_run(automation.run_epic())
+        else:
+            if uvloop is not None:
+                uvloop.install()
+            asyncio.run(automation.run_epic())
 
     except KeyboardInterrupt:
         print("\n\n[yellow]Automation interrupted by user[/yellow]")
@@ -6,17 +6,105 @@ Provides command validation, resource limits, and sandboxed execution
 to prevent dangerous operations and system damage.
 """
 
+import codecs
 import os
 import re
-import subprocess
-import tempfile
-import shutil
-import asyncio
+import secrets
+import shlex
+import signal
+import string
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
+try:
+    import ahocorasick  # Optional: multi-literal DFA scan for blocked commands
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # Optional: linear-time (non-backtracking) regex engine
+except ImportError:
+    re2 = None
+
+# Every blocked pattern is ASCII; ASCII mode keeps case folding and \b/\s
+# to the cheap 7-bit tables
+_BLOCKED_FLAGS = re.IGNORECASE | re.ASCII
+
+# ASCII-only lowercasing, matching _BLOCKED_FLAGS folding. str.lower() would
+# also fold e.g. U+212A KELVIN SIGN to 'k', which no named pattern matches.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Blocked patterns that are plain alternations of literal words
+_LITERAL_PATTERN_RE = re.compile(r'[\w/-]+(?:\|[\w/-]+)*')
+
+
+def _split_blocked_patterns(patterns: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """Split patterns into {literal word: pattern} and genuine regexes."""
+    literals, regexes = {}, []
+    for pattern in patterns:
+        if _LITERAL_PATTERN_RE.fullmatch(pattern):
+            for word in pattern.split('|'):
+                literals.setdefault(word.translate(_ASCII_LOWER), pattern)
+        else:
+            regexes.append(pattern)
+    return literals, regexes
+
+
+def _compile_union(patterns: List[str]):
+    """Compile patterns as one case-insensitive alternation.
+
+    Returns (stdlib regex, RE2 regex or None).
+    """
+    union = "(?:" + ")|(?:".join(patterns) + ")"
+    compiled_re2 = None
+    if re2 is not None:
+        try:
+            compiled_re2 = re2.compile("(?i)" + union)
+        except Exception:
+            pass  # Pattern not supported by RE2 - use the stdlib engine
+    return re.compile(union, _BLOCKED_FLAGS), compiled_re2
+
+
+def _build_literal_automaton(literals: Dict[str, str]):
+    """Build an Aho-Corasick automaton over literal words (None if unavailable)."""
+    if ahocorasick is None or not literals:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word, pattern in literals.items():
+        automaton.add_word(word, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _decode_head(data: bytes, limit: int) -> str:
+    """Decode at most limit bytes of process output without copying the rest.
+
+    A multibyte character cut by the limit is dropped rather than decoded
+    as U+FFFD.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    return decoder.decode(memoryview(data)[:limit], final=len(data) <= limit)
+
+
+def _recent(log: deque, count: int = 10) -> List[Dict]:
+    """Last count entries of a log deque, oldest first, with ISO timestamps.
+
+    Entries store raw time.time_ns() stamps; formatting happens only here.
+    """
+    entries = []
+    for entry in islice(log, max(len(log) - count, 0), None):
+        entry = dict(entry)
+        entry["timestamp"] = datetime.fromtimestamp(entry.pop("timestamp_ns") / 1e9).isoformat()
+        entries.append(entry)
+    return entries
+
 
 class SafetyLevel(Enum):
     """Safety enforcement levels"""
@@ -30,6 +118,28 @@ class SafetyViolation(Exception):
     pass
 
 
+@dataclass(slots=True)
+class ExecResult:
+    """Outcome of one agent command execution"""
+    success: bool
+    stdout: str = ""
+    stderr: str = ""
+    returncode: Optional[int] = None
+    error: str = ""
+    message: str = ""
+    agent: str = ""
+    command: str = ""
+    timeout: bool = False
+    safety_blocked: bool = False
+    dry_run: bool = False
+    sandboxed: bool = False
+    exception: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary (for reports and serialization)"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 class SafetyConstraints:
     """Enforce safety boundaries for AI agent execution"""
 
@@ -66,6 +176,17 @@ class SafetyConstraints:
         r'/etc/passwd|/etc/shadow|/etc/sudoers', # No auth file edits
     ]
 
+    # Literal patterns go through a single Aho-Corasick pass when pyahocorasick
+    # is installed; everything else is one precompiled regex union (RE2 when
+    # available). The individual patterns are only consulted to name the one
+    # that fired. Both regex forms are compiled on first use, so importing
+    # the module (or never validating a command) costs no regex compilation.
+    _BLOCKED_LITERALS, _BLOCKED_REGEXES = _split_blocked_patterns(BLOCKED_COMMANDS)
+    _BLOCKED_AUTOMATON = _build_literal_automaton(_BLOCKED_LITERALS)
+    _BLOCKED_RE = None        # See _blocked_re()
+    _BLOCKED_RE2 = None
+    _BLOCKED_PATTERNS = None  # See _blocked_pattern_name()
+
     # Restricted directories (read-only or no access)
     PROTECTED_PATHS = [
         '/etc',
@@ -85,6 +206,22 @@ class SafetyConstraints:
         '/var/lib',
         '/home',  # Except specific user dir
     ]
+    _PROTECTED_PREFIXES = tuple(PROTECTED_PATHS)  # For one C-level startswith()
+
+    # First characters of the shell-injection sequences checked in
+    # _check_command; one character-class scan rules out clean commands
+    _INJECTION_FIRST_CHARS = re.compile(r'[`$&|;\n]')
+    _STRICT_INJECTION_FIRST_CHARS = re.compile(r'[`$&|;\n<>]')
+
+    # Injection tokens, in reporting order
+    _DANGEROUS_CHARS = ('`', '$((', '$(', '${', '&&', '||', ';', '\n')
+    _STRICT_DANGEROUS_CHARS = _DANGEROUS_CHARS + ('|', '>', '<', '>>', '&')
+
+    # Network commands refused in STRICT mode. Matched as words anywhere in
+    # the command rather than as whitespace tokens, so '/usr/bin/curl' or a
+    # quoted "curl" are still caught.
+    NETWORK_COMMANDS = frozenset(('curl', 'wget', 'ssh', 'scp', 'rsync', 'telnet', 'ftp'))
+    _NET_RE = re.compile(r'\b(?:' + '|'.join(sorted(NETWORK_COMMANDS)) + r')\b', re.ASCII)
 
     # File operation limits
     MAX_FILE_SIZE = 100 * 1024 * 1024     # 100MB
@@ -93,6 +230,9 @@ class SafetyConstraints:
     MAX_PATH_LENGTH = 255                  # Max path length
     MAX_COMMAND_LENGTH = 10000             # Max command length
 
+    # Log retention (oldest entries are evicted beyond this)
+    MAX_LOG_ENTRIES = 10000
+
     def __init__(self,
                  workspace_root: str = None,
                  safety_level: SafetyLevel = SafetyLevel.STANDARD):
@@ -103,9 +243,14 @@ class SafetyConstraints:
             safety_level: Level of safety enforcement
         """
         self.workspace_root = Path(workspace_root or os.getcwd()).resolve()
+        # String forms for allocation-free containment/depth checks
+        self._workspace_str = str(self.workspace_root)
+        self._workspace_prefix = self._workspace_str.rstrip(os.sep) + os.sep
         self.safety_level = safety_level
-        self.operation_log = []
-        self.violation_log = []
+        self.operation_log = deque(maxlen=self.MAX_LOG_ENTRIES)
+        self.violation_log = deque(maxlen=self.MAX_LOG_ENTRIES)
+        self.total_operations = 0
+        self.total_violations = 0
 
     def validate_command(self, command: str) -> Tuple[bool, str]:
         """Validate command is safe to execute
@@ -116,40 +261,115 @@ class SafetyConstraints:
         Returns:
             Tuple of (is_safe, message)
         """
+        is_safe, message, violation = self._check_command(self.safety_level, command)
+
+        if violation:
+            self.log_violation(command, message)
+
+            if violation == 'blocked' and self.safety_level == SafetyLevel.STRICT:
+                raise SafetyViolation(message)
+
+        return is_safe, message
+
+    def validate_commands_bulk(self, commands: List[str]) -> List[Tuple[bool, str]]:
+        """Validate a batch of commands (e.g. every agent action of a story)
+
+        Repeated commands in a batch are answered from the _check_command
+        cache; violations are logged (and raised in STRICT mode) exactly as
+        validate_command does.
+
+        Args:
+            commands: Shell commands to validate
+
+        Returns:
+            List of (is_safe, message), one per command
+        """
+        return [self.validate_command(command) for command in commands]
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _check_command(cls,
+                       safety_level: SafetyLevel,
+                       command: str) -> Tuple[bool, str, Optional[str]]:
+        """Pure (cacheable) command checks
+
+        Returns:
+            Tuple of (is_safe, message, violation) where violation is
+            'blocked', 'injection', or None when nothing should be logged
+        """
         # Check command length
-        if len(command) > self.MAX_COMMAND_LENGTH:
-            return False, f"Command exceeds maximum length ({self.MAX_COMMAND_LENGTH})"
+        if len(command) > cls.MAX_COMMAND_LENGTH:
+            return False, f"Command exceeds maximum length ({cls.MAX_COMMAND_LENGTH})", None
 
         # Check against blocked patterns
-        for pattern in self.BLOCKED_COMMANDS:
-            if re.search(pattern, command, re.IGNORECASE):
-                violation = f"Command matches dangerous pattern: '{pattern}'"
-                self.log_violation(command, violation)
-
-                if self.safety_level == SafetyLevel.STRICT:
-                    raise SafetyViolation(violation)
+        if cls._matches_blocked(command):
+            pattern = cls._blocked_pattern_name(command)
+            return False, f"Command matches dangerous pattern: '{pattern}'", 'blocked'
 
-                return False, violation
+        strict = safety_level == SafetyLevel.STRICT
 
         # Check for shell injection attempts
-        dangerous_chars = ['`', '$((', '$(', '${', '&&', '||', ';', '\n']
-        if self.safety_level == SafetyLevel.STRICT:
-            dangerous_chars.extend(['|', '>', '<', '>>', '&'])
-
-        for char in dangerous_chars:
-            if char in command and not self._is_quoted(command, char):
-                violation = f"Potential shell injection: '{char}' found"
-                self.log_violation(command, violation)
-                return False, violation
+        if strict:
+            dangerous_chars = cls._STRICT_DANGEROUS_CHARS
+            first_chars = cls._STRICT_INJECTION_FIRST_CHARS
+        else:
+            dangerous_chars = cls._DANGEROUS_CHARS
+            first_chars = cls._INJECTION_FIRST_CHARS
+
+        if first_chars.search(command):
+            quote_mask = None
+            for char in dangerous_chars:
+                idx = command.find(char)
+                if idx == -1:
+                    continue
+                if quote_mask is None:
+                    quote_mask = cls._quote_mask(command)
+                while idx != -1:
+                    if not quote_mask[idx]:
+                        return False, f"Potential shell injection: '{char}' found", 'injection'
+                    idx = command.find(char, idx + 1)
 
         # Check for network operations (optional restriction)
-        if self.safety_level == SafetyLevel.STRICT:
-            network_commands = ['curl', 'wget', 'ssh', 'scp', 'rsync', 'telnet', 'ftp']
-            for net_cmd in network_commands:
-                if re.search(rf'\b{net_cmd}\b', command):
-                    return False, f"Network operation not allowed: {net_cmd}"
-
-        return True, "Command validated"
+        if strict:
+            match = cls._NET_RE.search(command)
+            if match:
+                return False, f"Network operation not allowed: {match.group()}", None
+
+        return True, "Command validated", None
+
+    @classmethod
+    def _matches_blocked(cls, command: str) -> bool:
+        """Return True if command matches any blocked pattern."""
+        automaton = cls._BLOCKED_AUTOMATON
+        if automaton is not None and next(automaton.iter(command.translate(_ASCII_LOWER)), None) is not None:
+            return True
+        return cls._blocked_re(command).search(command) is not None
+
+    @classmethod
+    def _blocked_re(cls, command: str):
+        """Compiled blocked-pattern union to scan command with (compiled on first call)
+
+        RE2 folds case over Unicode while the stdlib union and the named
+        patterns fold ASCII only, so RE2 is used only for ASCII commands,
+        where the two agree.
+        """
+        if cls._BLOCKED_RE is None:
+            cls._BLOCKED_RE, cls._BLOCKED_RE2 = _compile_union(
+                cls._BLOCKED_REGEXES if cls._BLOCKED_AUTOMATON is not None
+                else cls.BLOCKED_COMMANDS
+            )
+        if cls._BLOCKED_RE2 is not None and command.isascii():
+            return cls._BLOCKED_RE2
+        return cls._BLOCKED_RE
+
+    @classmethod
+    def _blocked_pattern_name(cls, command: str) -> str:
+        """Name the first blocked pattern matching command"""
+        if cls._BLOCKED_PATTERNS is None:
+            cls._BLOCKED_PATTERNS = [(p, re.compile(p, _BLOCKED_FLAGS))
+                                     for p in cls.BLOCKED_COMMANDS]
+        return next((p for p, regex in cls._BLOCKED_PATTERNS if regex.search(command)),
+                    '<blocked pattern>')
 
     def validate_file_operation(self,
                                file_path: str,
@@ -163,46 +383,78 @@ class SafetyConstraints:
         Returns:
             Tuple of (is_safe, message)
         """
+        # Resolve once (symlinks included); every check uses the real path
         try:
-            path = Path(file_path).resolve()
+            path_str = os.path.realpath(file_path)
         except Exception as e:
             return False, f"Invalid path: {e}"
+        return self._check_real_path(path_str, operation)
+
+    def validate_file_operations(self,
+                                file_paths: List[str],
+                                operation: str) -> List[Tuple[bool, str]]:
+        """Validate one operation over many files
+
+        Args:
+            file_paths: Paths to files
+            operation: Type of operation (read, write, delete, execute)
+
+        Returns:
+            List of (is_safe, message), one per path; every path fails if
+            the batch exceeds MAX_FILES_PER_OPERATION
+        """
+        if len(file_paths) > self.MAX_FILES_PER_OPERATION:
+            message = f"Too many files in one operation ({self.MAX_FILES_PER_OPERATION} max)"
+            return [(False, message)] * len(file_paths)
+
+        realpath = os.path.realpath
+        check = self._check_real_path
+        results = []
+        for file_path in file_paths:
+            try:
+                path_str = realpath(file_path)
+            except Exception as e:
+                results.append((False, f"Invalid path: {e}"))
+                continue
+            results.append(check(path_str, operation))
+        return results
+
+    def _check_real_path(self, path_str: str, operation: str) -> Tuple[bool, str]:
+        """File operation checks on an already-resolved path"""
+        in_workspace = (path_str == self._workspace_str
+                        or path_str.startswith(self._workspace_prefix))
 
         # Check path length
-        if len(str(path)) > self.MAX_PATH_LENGTH:
+        if len(path_str) > self.MAX_PATH_LENGTH:
             return False, f"Path exceeds maximum length ({self.MAX_PATH_LENGTH})"
 
         # Must be within workspace (unless reading)
-        if operation != 'read':
-            try:
-                path.relative_to(self.workspace_root)
-            except ValueError:
-                return False, f"Path outside workspace: {path}"
+        if operation != 'read' and not in_workspace:
+            return False, f"Path outside workspace: {path_str}"
 
         # Check protected paths
-        for protected in self.PROTECTED_PATHS:
-            if str(path).startswith(protected):
-                if operation != 'read' or self.safety_level == SafetyLevel.STRICT:
-                    return False, f"Protected path: {protected}"
+        if path_str.startswith(self._PROTECTED_PREFIXES):
+            if operation != 'read' or self.safety_level == SafetyLevel.STRICT:
+                protected = next(p for p in self.PROTECTED_PATHS if path_str.startswith(p))
+                return False, f"Protected path: {protected}"
 
         # Check file size for write operations
-        if operation in ['write', 'append']:
-            if path.exists() and path.stat().st_size > self.MAX_FILE_SIZE:
+        if operation in ('write', 'append'):
+            try:
+                size = os.stat(path_str).st_size
+            except OSError:
+                size = 0  # New file
+            if size > self.MAX_FILE_SIZE:
                 return False, f"File exceeds size limit ({self.MAX_FILE_SIZE} bytes)"
 
-        # Check directory traversal depth
-        try:
-            depth = len(path.relative_to(self.workspace_root).parts)
+        # Check directory traversal depth (components below the workspace root)
+        if in_workspace and path_str != self._workspace_str:
+            depth = path_str.count(os.sep, len(self._workspace_prefix)) + 1
             if depth > self.MAX_DIRECTORY_DEPTH:
                 return False, f"Exceeds maximum directory depth ({self.MAX_DIRECTORY_DEPTH})"
-        except ValueError:
-            pass  # Not in workspace, already handled above
 
-        # Check for symlink attacks
-        if path.is_symlink() and self.safety_level != SafetyLevel.PERMISSIVE:
-            real_path = path.resolve()
-            if not str(real_path).startswith(str(self.workspace_root)):
-                return False, "Symlink points outside workspace"
+        # Symlinks were resolved above, so a link pointing outside the
+        # workspace already failed the workspace check for non-read operations
 
         return True, "File operation validated"
 
@@ -215,6 +467,8 @@ class SafetyConstraints:
         Returns:
             Dictionary with sandbox configuration
         """
+        import tempfile  # Deferred: validation-only callers never need it
+
         sandbox_root = Path(tempfile.mkdtemp(
             prefix=f"bmad_sandbox_{sandbox_id}_",
             dir="/tmp"
@@ -263,6 +517,8 @@ class SafetyConstraints:
         Args:
             sandbox_context: Sandbox configuration from create_sandbox_environment
         """
+        import shutil  # Deferred: validation-only callers never need it
+
         sandbox_root = sandbox_context.get("sandbox_root")
         if sandbox_root and os.path.exists(sandbox_root):
             try:
@@ -271,52 +527,55 @@ class SafetyConstraints:
             except Exception as e:
                 self.log_operation(f"Failed to destroy sandbox: {e}")
 
-    def _is_quoted(self, command: str, substring: str) -> bool:
-        """Check if substring appears within quotes in command"""
-        # Simple check - could be improved
-        in_single_quote = False
-        in_double_quote = False
+    @staticmethod
+    def _quote_mask(command: str) -> bytearray:
+        """Per-character quote state of command (non-zero = inside quotes)
 
+        Computed in one pass: bit 0 = inside single quotes, bit 1 = inside
+        double quotes. Quotes preceded by a backslash do not toggle state.
+        """
+        mask = bytearray(len(command))
+        state = 0
+        prev = ''
         for i, char in enumerate(command):
-            if char == "'" and (i == 0 or command[i-1] != '\\'):
-                in_single_quote = not in_single_quote
-            elif char == '"' and (i == 0 or command[i-1] != '\\'):
-                in_double_quote = not in_double_quote
-
-            if command[i:i+len(substring)] == substring:
-                if in_single_quote or in_double_quote:
-                    return True
-
-        return False
+            if char == "'" and prev != '\\':
+                state ^= 1
+            elif char == '"' and prev != '\\':
+                state ^= 2
+            mask[i] = state
+            prev = char
+        return mask
 
     def log_operation(self, operation: str, details: Dict = None):
         """Log a safety-checked operation"""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "operation": operation,
             "details": details or {},
             "safety_level": self.safety_level.value
         }
         self.operation_log.append(entry)
+        self.total_operations += 1
 
     def log_violation(self, command: str, reason: str):
         """Log a safety violation"""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "command": command[:500],  # Truncate for safety
             "reason": reason,
             "safety_level": self.safety_level.value
         }
         self.violation_log.append(entry)
+        self.total_violations += 1
 
     def get_safety_report(self) -> Dict[str, Any]:
         """Get summary of safety operations and violations"""
         return {
             "safety_level": self.safety_level.value,
             "workspace_root": str(self.workspace_root),
-            "total_operations": len(self.operation_log),
-            "total_violations": len(self.violation_log),
-            "recent_violations": self.violation_log[-10:],
+            "total_operations": self.total_operations,
+            "total_violations": self.total_violations,
+            "recent_violations": _recent(self.violation_log),
             "stats": {
                 "blocked_commands": len(self.BLOCKED_COMMANDS),
                 "protected_paths": len(self.PROTECTED_PATHS),
@@ -328,6 +587,9 @@ class SafetyConstraints:
 class SafeAgentExecutor:
     """Execute BMad agents with safety constraints"""
 
+    # Max bytes buffered while waiting for a worker's end-of-command marker
+    WORKER_STREAM_LIMIT = 16 * 1024 * 1024
+
     def __init__(self,
                  constraints: SafetyConstraints = None,
                  dry_run: bool = False):
@@ -339,13 +601,18 @@ class SafeAgentExecutor:
         """
         self.constraints = constraints or SafetyConstraints()
         self.dry_run = dry_run
-        self.execution_history = []
+        # Bounded; execution report statistics cover the retained entries
+        self.execution_history = deque(maxlen=SafetyConstraints.MAX_LOG_ENTRIES)
+        # Persistent shell per sandbox: sandbox_id -> (process, lock)
+        self._workers: Dict[str, Tuple[Any, Any]] = {}
+        # sandbox_id -> lock held while that sandbox's worker is started
+        self._spawn_locks: Dict[str, Any] = {}
 
     async def execute_agent_safely(self,
                                   agent: str,
                                   command: str,
                                   sandbox_context: Dict = None,
-                                  timeout: int = 300) -> Dict[str, Any]:
+                                  timeout: int = 300) -> ExecResult:
         """Execute agent command with all safety measures
 
         Args:
@@ -355,34 +622,31 @@ class SafeAgentExecutor:
             timeout: Command timeout in seconds
 
         Returns:
-            Execution result dictionary
+            Execution result
         """
         # Validate command
         is_safe, message = self.constraints.validate_command(command)
         if not is_safe:
-            return {
-                "success": False,
-                "error": message,
-                "agent": agent,
-                "command": command[:500],
-                "safety_blocked": True
-            }
+            return ExecResult(
+                success=False,
+                error=message,
+                agent=agent,
+                command=command[:500],
+                safety_blocked=True
+            )
 
         if self.dry_run:
             # Don't execute in dry run mode
-            return {
-                "success": True,
-                "agent": agent,
-                "command": command[:500],
-                "dry_run": True,
-                "message": "Dry run - command not executed"
-            }
-
-        # Prepare sandboxed execution if context provided
-        if sandbox_context:
-            command = self.prepare_sandboxed_command(command, sandbox_context)
+            return ExecResult(
+                success=True,
+                agent=agent,
+                command=command[:500],
+                dry_run=True,
+                message="Dry run - command not executed"
+            )
 
-        # Execute with resource limits
+        # Execute with resource limits (sandboxed commands run in the
+        # sandbox's persistent worker shell, which already applies its limits)
         result = await self.execute_with_limits(command, timeout, sandbox_context)
 
         # Log execution
@@ -390,7 +654,7 @@ class SafeAgentExecutor:
             "agent": agent,
             "command": command[:500],
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_ns": time.time_ns()
         })
 
         return result
@@ -405,15 +669,26 @@ class SafeAgentExecutor:
         Returns:
             Wrapped command with safety limits
         """
-        limits = context.get('limits', {})
-
         # Build environment variables
         env_vars = " ".join([
             f'{k}={v}' for k, v in context.get('env_vars', {}).items()
         ])
 
-        # Build ulimit constraints
-        ulimits = [
+        ulimits = self._sandbox_ulimits(context)
+
+        sandbox_wrapper = f"""
+cd {context['sandbox_root']} && \\
+/usr/bin/env -i {env_vars} \\
+bash -c '{"; ".join(ulimits)}; {command}'
+        """
+
+        return sandbox_wrapper.strip()
+
+    @staticmethod
+    def _sandbox_ulimits(context: Dict) -> List[str]:
+        """Build ulimit constraints for a sandbox context"""
+        limits = context.get('limits', {})
+        return [
             f"ulimit -t {limits.get('cpu_seconds', 300)}",
             f"ulimit -v {limits.get('memory_mb', 1024) * 1024}",
             f"ulimit -f {limits.get('file_size_mb', 100) * 1024}",
@@ -421,18 +696,119 @@ class SafeAgentExecutor:
             f"ulimit -n {limits.get('open_files', 100)}"
         ]
 
-        sandbox_wrapper = f"""
-cd {context['sandbox_root']} && \\
-/usr/bin/env -i {env_vars} \\
-bash -c '{"; ".join(ulimits)}; {command}'
+    async def _get_worker(self, context: Dict) -> Tuple[Any, Any]:
+        """Get (or start) the persistent worker shell for a sandbox
+
+        The worker is started once with a clean environment, the sandbox
+        root as cwd and the sandbox ulimits applied, so each command only
+        costs a subshell fork instead of fork+exec of timeout and bash.
         """
+        import asyncio
+
+        sandbox_id = context['sandbox_id']
+        worker = self._workers.get(sandbox_id)
+        if worker is not None and worker[0].returncode is None:
+            return worker
+
+        # Concurrent first calls share one spawn instead of each starting
+        # a shell and leaking all but the last
+        async with self._spawn_locks.setdefault(sandbox_id, asyncio.Lock()):
+            worker = self._workers.get(sandbox_id)
+            if worker is not None and worker[0].returncode is None:
+                return worker
+
+            process = await asyncio.create_subprocess_exec(
+                '/bin/bash', '--noprofile', '--norc',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=context['sandbox_root'],
+                env=dict(context.get('env_vars', {})),
+                start_new_session=True,  # Own process group, killed as a unit
+                limit=self.WORKER_STREAM_LIMIT
+            )
+            process.stdin.write(("; ".join(self._sandbox_ulimits(context)) + "\n").encode())
+
+            worker = (process, asyncio.Lock())
+            self._workers[sandbox_id] = worker
+            return worker
+
+    async def _run_in_worker(self, command: str, timeout: int, context: Dict) -> ExecResult:
+        """Run one command in the sandbox worker, framed by a random marker"""
+        import asyncio
+
+        process, lock = await self._get_worker(context)
+        marker = secrets.token_hex(16).encode()
+
+        async with lock:
+            # Subshell keeps cd/variable changes from leaking between
+            # commands; stdin is detached so commands can't eat the protocol.
+            # The command is eval'd from a quoted string so a parse error
+            # stays inside the subshell and the markers below still print.
+            process.stdin.write(
+                b"( eval " + shlex.quote(command).encode() + b" ) < /dev/null\n"
+                b"printf '\\n%s %d\\n' " + marker + b" $?\n"
+                b"printf '\\n%s\\n' " + marker + b" >&2\n"
+            )
 
-        return sandbox_wrapper.strip()
+            async def read_stdout():
+                data = await process.stdout.readuntil(b"\n" + marker + b" ")
+                returncode = int(await process.stdout.readline())
+                return data[:-len(marker) - 2], returncode
+
+            async def read_stderr():
+                data = await process.stderr.readuntil(b"\n" + marker + b"\n")
+                return data[:-len(marker) - 2]
+
+            try:
+                await process.stdin.drain()
+                (stdout, returncode), stderr = await asyncio.wait_for(
+                    asyncio.gather(read_stdout(), read_stderr()),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                self._kill_worker(context['sandbox_id'])
+                raise
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                    ValueError, OSError):
+                # Worker died or output exceeded the stream limit
+                self._kill_worker(context['sandbox_id'])
+                raise
+
+        return ExecResult(
+            success=returncode == 0,
+            stdout=_decode_head(stdout, 10000),
+            stderr=_decode_head(stderr, 5000),
+            returncode=returncode,
+            sandboxed=True
+        )
+
+    def _kill_worker(self, sandbox_id: str):
+        """Kill a sandbox worker and everything it started"""
+        worker = self._workers.pop(sandbox_id, None)
+        if worker is not None and worker[0].returncode is None:
+            try:
+                os.killpg(worker[0].pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    async def close_sandbox_worker(self, sandbox_context: Dict):
+        """Shut down the persistent worker shell for a sandbox
+
+        Call before SafetyConstraints.destroy_sandbox.
+        """
+        self._spawn_locks.pop(sandbox_context['sandbox_id'], None)
+        worker = self._workers.pop(sandbox_context['sandbox_id'], None)
+        if worker is None or worker[0].returncode is not None:
+            return
+        process = worker[0]
+        process.stdin.close()  # EOF ends the shell
+        await process.wait()
 
     async def execute_with_limits(self,
                                  command: str,
                                  timeout: int,
-                                 sandbox_context: Dict = None) -> Dict:
+                                 sandbox_context: Dict = None) -> ExecResult:
         """Execute command with resource limits and monitoring
 
         Args:
@@ -441,9 +817,14 @@ bash -c '{"; ".join(ulimits)}; {command}'
             sandbox_context: Optional sandbox configuration
 
         Returns:
-            Execution result dictionary
+            Execution result
         """
+        import asyncio  # Deferred: validation-only callers never need it
+
         try:
+            if sandbox_context:
+                return await self._run_in_worker(command, timeout, sandbox_context)
+
             # Add timeout wrapper
             timeout_cmd = f"timeout --preserve-status {timeout}s {command}"
 
@@ -452,47 +833,49 @@ bash -c '{"; ".join(ulimits)}; {command}'
                 timeout_cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=sandbox_context['sandbox_root'] if sandbox_context else None
             )
 
             stdout, stderr = await process.communicate()
 
-            return {
-                "success": process.returncode == 0,
-                "stdout": stdout.decode('utf-8', errors='replace')[:10000],
-                "stderr": stderr.decode('utf-8', errors='replace')[:5000],
-                "returncode": process.returncode,
-                "sandboxed": sandbox_context is not None
-            }
+            return ExecResult(
+                success=process.returncode == 0,
+                stdout=_decode_head(stdout, 10000),
+                stderr=_decode_head(stderr, 5000),
+                returncode=process.returncode
+            )
 
         except asyncio.TimeoutError:
-            return {
-                "success": False,
-                "error": f"Command exceeded timeout ({timeout}s)",
-                "timeout": True
-            }
+            return ExecResult(
+                success=False,
+                error=f"Command exceeded timeout ({timeout}s)",
+                timeout=True
+            )
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "exception": True
-            }
+            return ExecResult(
+                success=False,
+                error=str(e),
+                exception=True
+            )
 
     def get_execution_report(self) -> Dict[str, Any]:
         """Get summary of executions"""
         successful = sum(1 for h in self.execution_history
-                        if h['result'].get('success'))
+                        if h['result'].success)
         failed = len(self.execution_history) - successful
 
+        recent = _recent(self.execution_history)
+        for entry in recent:
+            entry['result'] = entry['result'].to_dict()
+
         return {
             "total_executions": len(self.execution_history),
             "successful": successful,
             "failed": failed,
             "safety_blocks": sum(1 for h in self.execution_history
-                                if h['result'].get('safety_blocked')),
+                                if h['result'].safety_blocked),
             "timeouts": sum(1 for h in self.execution_history
-                           if h['result'].get('timeout')),
-            "recent_executions": self.execution_history[-10:]
+                           if h['result'].timeout),
+            "recent_executions": recent
         }
 
 
@@ -546,12 +929,13 @@ if __name__ == "__main__":
             sandbox_context=sandbox,
             timeout=5
         )
-        print(f"  Success: {result['success']}")
-        if result.get('stdout'):
-            print(f"  Output: {result['stdout'].strip()}")
+        print(f"  Success: {result.success}")
+        if result.stdout:
+            print(f"  Output: {result.stdout.strip()}")
         print()
 
         # Cleanup
+        await executor.close_sandbox_worker(sandbox)
         constraints.destroy_sandbox(sandbox)
         print("  Sandbox destroyed")
 
@@ -7,14 +7,54 @@ for parallel agent execution with full visibility.
 """
 
 import libtmux
+import libtmux.exc
 import subprocess
+import atexit
 import json
+import os
+import queue
+import select
+import shlex
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
+# Reused encoder - json.dump(indent=2) builds a new JSONEncoder per call
+_encode_checkpoint = json.JSONEncoder(indent=2).encode
+
+# Managers with a running checkpoint writer, flushed once at interpreter exit.
+# Weak, so exit handling never keeps a discarded manager alive.
+_checkpointing_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_checkpoints():
+    for manager in list(_checkpointing_managers):
+        manager.flush_checkpoints()
+
+# Story window panes in pane order: (agent, color, banner command). The
+# agent set is fixed, so banners are rendered once here, not per window.
+_AGENT_SPECS = tuple(
+    (agent, color, f"echo -e '\\033[1;{30 + idx}m=== {agent.upper()} PANE ==\\033[0m'")
+    for idx, (agent, color) in enumerate(zip(
+        ["sm-draft", "po-validate", "dev-implement", "qa-test"],
+        ["green", "yellow", "cyan", "magenta"]
+    ))
+)
+
+# Pane index of each agent in a story window
+_AGENT_PANE_INDEX = {"sm": 0, "po": 1, "dev": 2, "qa": 3}
+
+# Story windows are named STORY_PREFIX + story id
+_STORY_PREFIX = "story-"
+
+_STATUS_RIGHT = "#[fg=yellow]%H:%M:%S #[fg=cyan]| #(echo $USER)@#H"
+
 
 class TmuxLayoutType(Enum):
     """Available tmux layout types"""
@@ -28,6 +68,15 @@ class TmuxLayoutType(Enum):
 class BmadTmuxManager:
     """Manages tmux sessions for BMad epic automation"""
 
+    # pane_current_command values meaning the pane is back at a prompt
+    SHELL_COMMANDS = frozenset(["bash", "zsh", "sh", "dash", "fish", "ksh"])
+
+    # Seconds a pane capture is reused by repeated capture_pane_output calls
+    CAPTURE_TTL = 2.0
+
+    # Seconds to wait for a control-mode reply before dropping the client
+    CONTROL_REPLY_TIMEOUT = 10.0
+
     def __init__(self, epic_id: str, config: Dict = None):
         """Initialize tmux manager
 
@@ -39,11 +88,35 @@ class BmadTmuxManager:
         self.session_name = f"bmad-epic-{epic_id}"
         self.config = config or self._default_config()
 
+        # Resolved once; every window and log file reuses these
+        self._cwd_str = str(Path.cwd())
+        self._log_dir = Path(self.config.get("log_dir", Path.home() / "automation" / "logs"))
+        self._log_dir_created = False
+
         self.server = libtmux.Server()
         self.session = None
         self.windows = {}
         self.panes = {}
         self.creation_time = None
+        # Story ids with a window, in creation order (an ordered set kept
+        # in step with self.windows so story scans don't walk every window)
+        self._story_windows = {}
+
+        # Control-mode client (tmux -C) used to send commands over one pipe
+        # instead of spawning a tmux client per command; see _send()
+        self._ctl = None
+        self._ctl_buf = bytearray()  # Reply bytes read but not yet consumed
+        self._ctl_lock = threading.Lock()
+
+        # capture_pane_lines cache: (story, agent, lines) -> (time, lines)
+        self._capture_cache = {}
+        self._capture_in_flight = {}
+        self._capture_lock = threading.Lock()
+
+        # Background checkpoint writer (started on first checkpoint)
+        self._checkpoint_queue = queue.SimpleQueue()
+        self._checkpoint_thread = None
+        self._checkpoint_stop = None
 
     def _default_config(self) -> Dict:
         """Get default configuration"""
@@ -55,6 +128,8 @@ class BmadTmuxManager:
             "auto_attach": False,
             "mouse_support": True,
             "status_interval": 1,
+            "session_width": 200,
+            "session_height": 50,
         }
 
     def initialize_epic_session(self, working_dir: str = None) -> bool:
@@ -66,24 +141,32 @@ class BmadTmuxManager:
         Returns:
             True if session created successfully
         """
-        working_dir = working_dir or str(Path.cwd())
+        working_dir = working_dir or self._cwd_str
 
         # Kill existing session if it exists
         try:
-            existing = self.server.find_where({"session_name": self.session_name})
-            if existing:
+            if self._has_session(self.session_name):
                 print(f"Killing existing session: {self.session_name}")
-                existing.kill_session()
-                time.sleep(1)  # Give it time to clean up
-        except:
-            pass
+                subprocess.run(
+                    ["tmux", "kill-session", "-t", f"={self.session_name}"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                # Wait until it is gone (bounded) rather than a fixed sleep
+                deadline = time.monotonic() + 0.5
+                while self._has_session(self.session_name) and time.monotonic() < deadline:
+                    time.sleep(0.02)
+        except OSError:
+            pass  # tmux binary not runnable; new_session below reports it
 
         try:
             # Create new session
             self.session = self.server.new_session(
                 session_name=self.session_name,
                 window_name="orchestrator",
-                start_directory=working_dir
+                start_directory=working_dir,
+                x=self.config.get("session_width", 200),
+                y=self.config.get("session_height", 50)
             )
 
             self.creation_time = datetime.now()
@@ -103,32 +186,224 @@ class BmadTmuxManager:
             print(f"✗ Failed to create tmux session: {e}")
             return False
 
+    @staticmethod
+    def _has_session(session_name: str) -> bool:
+        """Check for a session by exact name (one tmux call, no listing)
+
+        Args:
+            session_name: Session name
+
+        Returns:
+            True if the session exists
+        """
+        # '=' makes tmux match the whole name, not a prefix
+        return subprocess.run(
+            ["tmux", "has-session", "-t", f"={session_name}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        ).returncode == 0
+
+    def _pane_command(self, pane_id: str) -> str:
+        """Get the name of a pane's foreground process
+
+        Args:
+            pane_id: Pane identifier (%N)
+
+        Returns:
+            Process name, e.g. 'bash'
+        """
+        output = self._send("display-message", "-p", "-t", pane_id, "#{pane_current_command}")
+        return output[0] if output else ""
+
+    def _control(self) -> Optional[subprocess.Popen]:
+        """Get (or start) the control-mode client attached to the session
+
+        Returns:
+            Control-mode process, or None if it can't be started
+        """
+        if self._ctl is not None and self._ctl.poll() is None:
+            return self._ctl
+        self._ctl = None
+        if not self.session:
+            return None
+
+        ctl = None
+        try:
+            ctl = subprocess.Popen(
+                ["tmux", "-C", "attach-session", "-t", self.session_name],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            self._ctl_buf.clear()
+            # Reply to the attach itself, then stop pane output notifications
+            self._read_control_reply(ctl)
+            ctl.stdin.write(b"refresh-client -f no-output\n")
+            ctl.stdin.flush()
+            self._read_control_reply(ctl)
+        except (OSError, EOFError, TimeoutError):
+            if ctl is not None:
+                ctl.kill()
+                ctl.wait()
+            return None
+
+        self._ctl = ctl
+        return ctl
+
+    def _read_control_reply(self, ctl: subprocess.Popen) -> Tuple[List[str], bool]:
+        """Read one %begin/%end (or %error) reply block from a control client
+
+        Returns:
+            Tuple of (output lines, succeeded)
+
+        Raises:
+            EOFError: If the control client exits
+            TimeoutError: If the reply takes over CONTROL_REPLY_TIMEOUT seconds
+        """
+        deadline = time.monotonic() + self.CONTROL_REPLY_TIMEOUT
+
+        # Skip asynchronous notifications until the reply starts
+        while True:
+            line = self._read_control_line(ctl, deadline)
+            if line.startswith("%begin "):
+                break
+
+        # Guard lines repeat the %begin fields, so pane text can't end a block
+        fields = line[len("%begin "):]
+        end, error = "%end " + fields, "%error " + fields
+        output = []
+        while True:
+            line = self._read_control_line(ctl, deadline)
+            if line == end or line == error:
+                return output, line == end
+            output.append(line.rstrip("\n"))
+
+    def _read_control_line(self, ctl: subprocess.Popen, deadline: float) -> str:
+        """Read one line from a control client, waiting until deadline at most"""
+        buf = self._ctl_buf
+        start = 0
+        while (newline := buf.find(b"\n", start)) < 0:
+            start = len(buf)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([ctl.stdout], [], [], remaining)[0]:
+                raise TimeoutError("tmux control client did not reply")
+            chunk = os.read(ctl.stdout.fileno(), 65536)
+            if not chunk:
+                raise EOFError("tmux control client closed")
+            buf += chunk
+        line = buf[:newline + 1].decode("utf-8", "replace")
+        del buf[:newline + 1]
+        return line
+
+    def _send(self, *args: str) -> List[str]:
+        """Run one tmux command, over the control-mode pipe when available
+
+        Args:
+            *args: tmux command and arguments
+
+        Returns:
+            Output lines of the command
+        """
+        return self._send_batch([args])
+
+    def _send_batch(self, commands: List[Tuple[str, ...]]) -> List[str]:
+        """Run tmux commands as one ';'-separated command list (one round-trip)
+
+        Uses the control-mode pipe when available and falls back to a regular
+        libtmux call (one client for the whole list) if the control client
+        can't be started or has gone away. Control mode reads one command
+        list per line, so commands with a line break in an argument always
+        take the fallback. As with the tmux CLI, the first failing command
+        ends the list.
+
+        Args:
+            commands: tmux commands, each a tuple of command and arguments
+
+        Returns:
+            Output lines of all commands
+
+        Raises:
+            libtmux.exc.LibTmuxException: If a command fails or times out
+        """
+        multiline = any("\n" in arg or "\r" in arg for args in commands for arg in args)
+        with self._ctl_lock:
+            ctl = None if multiline else self._control()
+            if ctl is not None:
+                try:
+                    line = " ; ".join(shlex.join(args) for args in commands) + "\n"
+                    ctl.stdin.write(line.encode())
+                    ctl.stdin.flush()
+                    output = []
+                    for _ in commands:
+                        lines, succeeded = self._read_control_reply(ctl)
+                        if not succeeded:
+                            # tmux skips the rest of the list, without replies
+                            raise libtmux.exc.LibTmuxException("\n".join(lines))
+                        output.extend(lines)
+                    return output
+                except TimeoutError as e:
+                    # The commands may still run; don't repeat them via libtmux
+                    self._close_control()
+                    raise libtmux.exc.LibTmuxException(str(e)) from e
+                except (OSError, EOFError):
+                    self._close_control()
+
+        argv = []
+        for args in commands:
+            if argv:
+                argv.append(";")
+            argv.extend(args)
+        result = self.server.cmd(*argv)
+        if result.stderr:
+            raise libtmux.exc.LibTmuxException("\n".join(result.stderr))
+        return result.stdout
+
+    def _close_control(self):
+        """Detach and reap the control-mode client"""
+        ctl, self._ctl = self._ctl, None
+        if ctl is None:
+            return
+        try:
+            ctl.stdin.close()  # EOF detaches the control client
+            ctl.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            ctl.kill()
+
     def _configure_session(self):
         """Configure tmux session settings"""
         if not self.session:
             return
 
+        options = {}
+
         # Enable mouse support
         if self.config.get("mouse_support"):
-            self.session.set_option("mouse", "on")
+            options["mouse"] = "on"
 
         # Set status bar
-        self.session.set_option("status", "on")
-        self.session.set_option("status-position", "top")
-        self.session.set_option("status-interval", self.config.get("status_interval", 1))
+        options["status"] = "on"
+        options["status-position"] = "top"
+        options["status-interval"] = self.config.get("status_interval", 1)
+
+        # Keep detached windows at a bounded grid size
+        options["default-size"] = (f"{self.config.get('session_width', 200)}x"
+                                   f"{self.config.get('session_height', 50)}")
 
         # Set colors
-        self.session.set_option("status-bg", "colour235")
-        self.session.set_option("status-fg", "colour136")
+        options["status-bg"] = "colour235"
+        options["status-fg"] = "colour136"
 
         # Custom status line
-        status_left = f"#[fg=green]Epic: {self.epic_id} "
-        status_right = "#[fg=yellow]%H:%M:%S #[fg=cyan]| #(echo $USER)@#H"
+        options["status-left"] = f"#[fg=green]Epic: {self.epic_id} "
+        options["status-right"] = _STATUS_RIGHT
+        options["status-left-length"] = "30"
+        options["status-right-length"] = "60"
 
-        self.session.set_option("status-left", status_left)
-        self.session.set_option("status-right", status_right)
-        self.session.set_option("status-left-length", "30")
-        self.session.set_option("status-right-length", "60")
+        # Apply all options in one tmux round-trip
+        self._send_batch([
+            ("set-option", "-t", self.session_name, option, str(value))
+            for option, value in options.items()
+        ])
 
     def _create_default_windows(self):
         """Create default window structure"""
@@ -140,26 +415,28 @@ class BmadTmuxManager:
         orchestrator_window.rename_window("orchestrator")
         self.windows["orchestrator"] = orchestrator_window
 
-        # Monitoring window
-        monitoring_window = self.session.new_window(
-            window_name="monitoring",
-            start_directory=str(Path.cwd())
-        )
-        self.windows["monitoring"] = monitoring_window
-
-        # Logs window
-        logs_window = self.session.new_window(
-            window_name="logs",
-            start_directory=str(self.config.get("log_dir", "."))
-        )
-        self.windows["logs"] = logs_window
-
-        # HITL (Human-in-the-loop) window
-        hitl_window = self.session.new_window(
-            window_name="hitl",
-            start_directory=str(Path.cwd())
-        )
-        self.windows["hitl"] = hitl_window
+        # Monitoring, logs and HITL (Human-in-the-loop) windows, created
+        # concurrently; explicit indices keep their order deterministic
+        specs = [
+            ("monitoring", self._cwd_str),
+            ("logs", str(self._log_dir)),
+            ("hitl", self._cwd_str),
+        ]
+        base_index = int(orchestrator_window.index)
+
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            futures = {
+                name: executor.submit(
+                    self.session.new_window,
+                    window_name=name,
+                    start_directory=directory,
+                    window_index=str(base_index + offset),
+                    attach=False
+                )
+                for offset, (name, directory) in enumerate(specs, start=1)
+            }
+            for name, future in futures.items():
+                self.windows[name] = future.result()
 
     def create_story_window(self, story_id: str, layout: str = None) -> Optional[Any]:
         """Create dedicated window for story execution
@@ -174,7 +451,7 @@ class BmadTmuxManager:
         if not self.session:
             return None
 
-        window_name = f"story-{story_id}"
+        window_name = _STORY_PREFIX + story_id
 
         # Check if window already exists
         if window_name in self.windows:
@@ -184,7 +461,7 @@ class BmadTmuxManager:
             # Create story window
             story_window = self.session.new_window(
                 window_name=window_name,
-                start_directory=str(Path.cwd())
+                start_directory=self._cwd_str
             )
 
             # Create 4 panes for each agent phase (2x2 grid)
@@ -192,9 +469,10 @@ class BmadTmuxManager:
 
             # Apply layout
             layout = layout or self.config.get("window_layout", "tiled")
-            story_window.select_layout(layout)
+            self._send("select-layout", "-t", story_window.id, layout)
 
             self.windows[window_name] = story_window
+            self._story_windows[story_id] = None
 
             # Enable logging if configured
             if self.config.get("enable_logging"):
@@ -228,17 +506,14 @@ class BmadTmuxManager:
         panes = window.panes
 
         # Assign panes to agents and set titles
-        agents = ["sm-draft", "po-validate", "dev-implement", "qa-test"]
-        colors = ["green", "yellow", "cyan", "magenta"]
+        story_echo = f"echo 'Story: {story_id}'"
 
-        for idx, (pane, agent, color) in enumerate(zip(panes, agents, colors)):
+        for pane, (agent, color, banner) in zip(panes, _AGENT_SPECS):
             # Store pane reference
             self.panes[f"{story_id}_{agent}"] = pane
 
-            # Send initial message to pane
-            pane.send_keys(f"echo -e '\\033[1;{30 + idx}m=== {agent.upper()} PANE ==\\033[0m'")
-            pane.send_keys(f"echo 'Story: {story_id}'")
-            pane.send_keys(f"echo 'Ready for agent execution...'")
+            # Send initial message to pane (one compound line, one round-trip)
+            pane.send_keys(f"{banner}; {story_echo}; echo 'Ready for agent execution...'")
 
     def execute_agent_in_pane(self, story_id: str, agent: str, command: str) -> bool:
         """Execute BMad agent in dedicated pane
@@ -252,37 +527,32 @@ class BmadTmuxManager:
             True if command sent successfully
         """
         # Get or create story window
-        window = self.windows.get(f"story-{story_id}")
+        window = self.windows.get(_STORY_PREFIX + story_id)
         if not window:
             window = self.create_story_window(story_id)
 
-        # Map agent to pane index
-        pane_mapping = {
-            "sm": 0,
-            "po": 1,
-            "dev": 2,
-            "qa": 3
-        }
-
-        pane_idx = pane_mapping.get(agent, 0)
-
         try:
-            pane = window.panes[pane_idx]
+            pane = self._agent_pane(window, story_id, agent)
 
-            # Clear pane
+            # Interrupt whatever is running, then wait (bounded) only until
+            # the pane's foreground process is a shell again
             pane.send_keys("C-c", suppress_history=True)  # Kill any running process
-            time.sleep(0.5)
-            pane.send_keys("clear")
-
-            # Send execution header
-            pane.send_keys(f"echo '════════════════════════════════════'")
-            pane.send_keys(f"echo 'Executing: {agent.upper()} for {story_id}'")
-            pane.send_keys(f"echo 'Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}'")
-            pane.send_keys(f"echo '════════════════════════════════════'")
-            pane.send_keys("")
-
-            # Execute command
-            pane.send_keys(command)
+            deadline = time.monotonic() + 0.5
+            while self._pane_command(pane.id) not in self.SHELL_COMMANDS and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            # Clear, print execution header and run the command as one
+            # compound line (one send-keys round-trip instead of seven)
+            pane.send_keys("; ".join([
+                "clear",
+                "echo '════════════════════════════════════'",
+                f"echo 'Executing: {agent.upper()} for {story_id}'",
+                f"echo 'Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}'",
+                "echo '════════════════════════════════════'",
+                "echo",
+                command,
+            ]))
+            self.invalidate_capture(story_id, agent)
 
             return True
 
@@ -301,27 +571,78 @@ class BmadTmuxManager:
         Returns:
             Captured output text
         """
-        window = self.windows.get(f"story-{story_id}")
-        if not window:
-            return ""
+        return "\n".join(self.capture_pane_lines(story_id, agent, lines))
+
+    def capture_pane_lines(self, story_id: str, agent: str, lines: int = -1) -> Tuple[str, ...]:
+        """Capture output from agent pane as lines
+
+        tmux already replies line by line, so callers that process lines
+        should use this rather than splitting capture_pane_output(). Results
+        are reused for CAPTURE_TTL seconds, and concurrent callers asking
+        for the same capture share a single tmux call.
+
+        Args:
+            story_id: Story identifier
+            agent: Agent name
+            lines: Number of lines to capture (-1 for all)
+
+        Returns:
+            Captured output lines
+        """
+        key = (story_id, agent, lines)
+        while True:
+            with self._capture_lock:
+                cached = self._capture_cache.get(key)
+                if cached and time.monotonic() - cached[0] < self.CAPTURE_TTL:
+                    return cached[1]
+                in_flight = self._capture_in_flight.get(key)
+                if in_flight is None:
+                    in_flight = self._capture_in_flight[key] = threading.Event()
+                    break
+            in_flight.wait()  # Another caller is capturing; use its result
+
+        try:
+            output = self._capture_pane(story_id, agent, lines)
+            with self._capture_lock:
+                self._capture_cache[key] = (time.monotonic(), output)
+        finally:
+            with self._capture_lock:
+                del self._capture_in_flight[key]
+            in_flight.set()
+
+        return output
 
-        pane_mapping = {"sm": 0, "po": 1, "dev": 2, "qa": 3}
-        pane_idx = pane_mapping.get(agent, 0)
+    def invalidate_capture(self, story_id: str, agent: str):
+        """Drop cached captures of an agent pane (e.g. after new input)
+
+        Args:
+            story_id: Story identifier
+            agent: Agent name
+        """
+        with self._capture_lock:
+            for key in [k for k in self._capture_cache if k[:2] == (story_id, agent)]:
+                del self._capture_cache[key]
+
+    def _capture_pane(self, story_id: str, agent: str, lines: int) -> Tuple[str, ...]:
+        """Capture output lines from agent pane (uncached)"""
+        window = self.windows.get(_STORY_PREFIX + story_id)
+        if not window:
+            return ()
 
         try:
-            pane = window.panes[pane_idx]
+            pane = self._agent_pane(window, story_id, agent)
 
             # Capture pane content
             if lines == -1:
-                output = pane.cmd("capture-pane", "-p").stdout
+                output = self._send("capture-pane", "-p", "-t", pane.id)
             else:
-                output = pane.cmd("capture-pane", "-p", f"-S -{lines}").stdout
+                output = self._send("capture-pane", "-p", "-t", pane.id, "-S", f"-{lines}")
 
-            return "\n".join(output) if output else ""
+            return tuple(output)
 
         except Exception as e:
             print(f"Failed to capture pane output: {e}")
-            return ""
+            return ()
 
     def _enable_pane_logging(self, window: Any, story_id: str):
         """Enable logging for all panes in window
@@ -330,22 +651,45 @@ class BmadTmuxManager:
             window: Tmux window object
             story_id: Story identifier
         """
-        log_dir = self.config.get("log_dir", Path.home() / "automation" / "logs")
-        log_dir = Path(log_dir)
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = self._log_dir
+        if not self._log_dir_created:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._log_dir_created = True
 
         agents = ["sm", "po", "dev", "qa"]
 
-        for idx, agent in enumerate(agents):
-            try:
-                pane = window.panes[idx]
-                log_file = log_dir / f"tmux-{self.epic_id}-{story_id}-{agent}.log"
+        # One pipe-pane per pane, all in one round-trip. 'exec' makes the
+        # shell tmux starts become cat, so each pane costs one process.
+        commands = []
+        for pane, agent in zip(window.panes, agents):
+            log_file = log_dir / f"tmux-{self.epic_id}-{story_id}-{agent}.log"
+            commands.append((
+                "pipe-pane", "-o", "-t", pane.id,
+                f"exec cat >> {shlex.quote(str(log_file))}"
+            ))
+
+        try:
+            self._send_batch(commands)
+        except Exception as e:
+            print(f"Failed to enable logging for story {story_id}: {e}")
 
-                # Start logging
-                pane.cmd("pipe-pane", f"-o 'cat >> {log_file}'")
+    def _agent_pane(self, window: Any, story_id: str, agent: str) -> Any:
+        """Get an agent's pane in a story window
 
-            except Exception as e:
-                print(f"Failed to enable logging for {agent}: {e}")
+        Uses the reference stored when the panes were created; only falls
+        back to listing the window's panes (a tmux query) if there is none.
+
+        Args:
+            window: Tmux window object
+            story_id: Story identifier
+            agent: Agent name (sm, po, dev, qa)
+
+        Returns:
+            Tmux pane object
+        """
+        pane_idx = _AGENT_PANE_INDEX.get(agent, 0)
+        pane = self.panes.get(f"{story_id}_{_AGENT_SPECS[pane_idx][0]}")
+        return pane if pane is not None else window.panes[pane_idx]
 
     def send_to_orchestrator(self, message: str):
         """Send message to orchestrator window
@@ -354,8 +698,9 @@ class BmadTmuxManager:
             message: Message to send
         """
         orchestrator = self.windows.get("orchestrator")
-        if orchestrator and orchestrator.panes:
-            orchestrator.panes[0].send_keys(message)
+        if orchestrator:
+            # A window target sends to its (only) pane - no pane listing
+            self._send("send-keys", "-t", orchestrator.id, message, "Enter")
 
     def send_to_monitoring(self, message: str):
         """Send message to monitoring window
@@ -364,25 +709,39 @@ class BmadTmuxManager:
             message: Message to send
         """
         monitoring = self.windows.get("monitoring")
-        if monitoring and monitoring.panes:
-            monitoring.panes[0].send_keys(message)
+        if monitoring:
+            self._send("send-keys", "-t", monitoring.id, message, "Enter")
 
-    def attach_to_session(self) -> bool:
+    def attach_to_session(self, replace_process: bool = False) -> bool:
         """Attach to tmux session
 
+        Args:
+            replace_process: Exec tmux in place of this process (no fork and
+                no wait); only for callers where attaching is the last action
+
         Returns:
             True if attach command executed
         """
+        argv = ["tmux", "attach-session", "-t", self.session_name]
         try:
-            subprocess.run(["tmux", "attach-session", "-t", self.session_name])
+            if replace_process:
+                self._close_control()
+                os.execvp(argv[0], argv)  # Only returns by raising OSError
+            subprocess.run(argv)
             return True
         except Exception as e:
             print(f"Failed to attach to session: {e}")
             return False
 
-    def create_session_checkpoint(self) -> Dict[str, Any]:
+    def create_session_checkpoint(self, wait: bool = False) -> Dict[str, Any]:
         """Save session state for recovery
 
+        The checkpoint is snapshotted immediately and written to disk by a
+        background thread; pending writes are flushed at interpreter exit.
+
+        Args:
+            wait: Block until the checkpoint is on disk
+
         Returns:
             Checkpoint dictionary
         """
@@ -391,25 +750,83 @@ class BmadTmuxManager:
             "session_name": self.session_name,
             "creation_time": self.creation_time.isoformat() if self.creation_time else None,
             "windows": list(self.windows.keys()),
-            "active_stories": [],
+            "active_stories": list(self._story_windows),
             "timestamp": datetime.now().isoformat()
         }
 
-        # Extract active stories
-        for window_name in self.windows.keys():
-            if window_name.startswith("story-"):
-                story_id = window_name.replace("story-", "")
-                checkpoint["active_stories"].append(story_id)
-
-        # Save to file
-        checkpoint_file = Path.home() / ".bmad-sessions" / f"{self.session_name}.checkpoint"
-        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        if self._checkpoint_thread is None:
+            # The writer only holds the queue, so the manager can still be
+            # collected; a None sentinel then stops the thread
+            self._checkpoint_thread = threading.Thread(
+                target=self._checkpoint_writer,
+                args=(self._checkpoint_queue,),
+                name=f"{self.session_name}-checkpoints",
+                daemon=True
+            )
+            self._checkpoint_thread.start()
+            self._checkpoint_stop = weakref.finalize(self, self._checkpoint_queue.put, None)
+            _checkpointing_managers.add(self)
 
-        with open(checkpoint_file, "w") as f:
-            json.dump(checkpoint, f, indent=2)
+        self._checkpoint_queue.put(checkpoint)
+        if wait:
+            self.flush_checkpoints()
 
         return checkpoint
 
+    def flush_checkpoints(self):
+        """Block until all queued checkpoints are written"""
+        if self._checkpoint_thread is None:
+            return
+        done = threading.Event()
+        self._checkpoint_queue.put(done)
+        done.wait()
+
+    def close_checkpoints(self):
+        """Write any queued checkpoints and stop the writer thread"""
+        if self._checkpoint_thread is None:
+            return
+        self._checkpoint_stop()  # Queues the None sentinel
+        self._checkpoint_thread.join()
+        self._checkpoint_thread = None
+        self._checkpoint_stop = None
+        _checkpointing_managers.discard(self)
+
+    @staticmethod
+    def _checkpoint_writer(checkpoint_queue: queue.SimpleQueue):
+        """Write queued checkpoints until a None sentinel (runs in the checkpoint thread)"""
+        running = True
+        while running:
+            items = [checkpoint_queue.get()]
+            while not checkpoint_queue.empty():
+                items.append(checkpoint_queue.get())
+            running = None not in items
+
+            # Only the newest checkpoint in a burst needs writing
+            checkpoints = [item for item in items if isinstance(item, dict)]
+            if checkpoints:
+                try:
+                    BmadTmuxManager._write_checkpoint(checkpoints[-1])
+                except OSError as e:
+                    print(f"Failed to write checkpoint: {e}")
+
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    @staticmethod
+    def _write_checkpoint(checkpoint: Dict[str, Any]):
+        """Save checkpoint to file atomically (write temp, then rename)
+
+        Args:
+            checkpoint: Checkpoint dictionary
+        """
+        checkpoint_file = Path.home() / ".bmad-sessions" / f"{checkpoint['session_name']}.checkpoint"
+        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_file = checkpoint_file.with_suffix(".checkpoint.tmp")
+        tmp_file.write_bytes(_encode_checkpoint(checkpoint).encode())
+        os.replace(tmp_file, checkpoint_file)
+
     def recover_from_checkpoint(self, checkpoint_file: str) -> bool:
         """Restore session from checkpoint after crash
 
@@ -425,26 +842,35 @@ class BmadTmuxManager:
 
             # Try to reconnect to existing session
             try:
-                self.session = self.server.find_where(
+                session = self.server.find_where(
                     {"session_name": checkpoint["session_name"]}
                 )
+            except libtmux.exc.LibTmuxException:
+                session = None  # No tmux server running
+
+            if session is not None:
+                self.session = session
                 print(f"✓ Reconnected to existing session: {checkpoint['session_name']}")
 
                 # Rebuild window references
                 for window in self.session.windows:
                     self.windows[window.name] = window
+                    story_id = window.name.removeprefix(_STORY_PREFIX)
+                    if story_id != window.name:
+                        self._story_windows[story_id] = None
 
                 return True
 
-            except:
+            else:
                 print(f"Session not found. Recreating from checkpoint...")
 
                 # Recreate session
                 self.initialize_epic_session()
 
-                # Recreate story windows
-                for story_id in checkpoint.get("active_stories", []):
-                    self.create_story_window(story_id)
+                # Recreate story windows (independent, so concurrently)
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(executor.map(self.create_story_window,
+                                      checkpoint.get("active_stories", [])))
 
                 print(f"✓ Session recreated from checkpoint")
                 return True
@@ -471,17 +897,20 @@ class BmadTmuxManager:
             "statistics": {}
         }
 
-        # Get window information
-        for name, window in self.windows.items():
-            info["windows"][name] = {
-                "id": window.id if hasattr(window, 'id') else None,
-                "panes": len(window.panes) if hasattr(window, 'panes') else 0
-            }
+        # Get window information (one list-windows call for all windows)
+        listed = {}
+        for line in self._send("list-windows", "-t", f"={self.session_name}",
+                               "-F", "#{window_id} #{window_panes} #{window_name}"):
+            window_id, panes, name = line.split(" ", 2)
+            listed[name] = {"id": window_id, "panes": int(panes)}
+
+        for name in self.windows:
+            info["windows"][name] = listed.get(name, {"id": None, "panes": 0})
 
         # Calculate statistics
         info["statistics"] = {
             "total_windows": len(self.windows),
-            "story_windows": sum(1 for w in self.windows if w.startswith("story-")),
+            "story_windows": len(self._story_windows),
             "uptime_minutes": (
                 (datetime.now() - self.creation_time).seconds / 60
                 if self.creation_time else 0
@@ -497,6 +926,8 @@ class BmadTmuxManager:
             True if session killed successfully
         """
         try:
+            self.close_checkpoints()
+            self._close_control()
             if self.session:
                 self.session.kill_session()
                 print(f"✓ Killed session: {self.session_name}")
@@ -504,6 +935,9 @@ class BmadTmuxManager:
             self.session = None
             self.windows = {}
             self.panes = {}
+            self._story_windows = {}
+            with self._capture_lock:
+                self._capture_cache.clear()
 
             return True
 
@@ -518,15 +952,20 @@ class BmadTmuxManager:
             List of session names
         """
         try:
-            sessions = self.server.list_sessions()
-            bmad_sessions = [
-                s.get("session_name", "") for s in sessions
-                if s.get("session_name", "").startswith("bmad-")
-            ]
-            return bmad_sessions
+            # Filter server-side and print names only - no Session objects
+            result = subprocess.run(
+                ["tmux", "list-sessions",
+                 "-F", "#{session_name}",
+                 "-f", "#{m:bmad-*,#{session_name}}"],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                return []  # No tmux server running
+            return result.stdout.splitlines()
 
-        except:
-            return []
+        except OSError:
+            return []  # tmux not installed
 
 
 # CLI interface for testing
@@ -567,7 +1006,7 @@ if __name__ == "__main__":
             sys.exit(1)
 
         manager = BmadTmuxManager(args.epic)
-        manager.attach_to_session()
+        manager.attach_to_session(replace_process=True)
 
     elif args.action == "info":
         if not args.epic: